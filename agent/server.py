@@ -14,21 +14,24 @@ Endpoints:
 - GET  /tools/balance - Get account balance
 - GET  /mcp/tools - MCP tool definitions
 - GET  /health - Service health check
+- HEAD /ready - Readiness probe (204 ready, 503 not yet)
 """
 
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Optional, Literal
 import logging
+import threading
 import time
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
 from config import settings
 from models import (
+    TradeSide,
     ConvictionExtraction,
     MarketMatch,
     TradeProposal,
@@ -65,6 +68,10 @@ from agent.tools import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Set once lifespan startup has initialized every service, so in-process
+# callers (main.py's combined mode) can check readiness without /health
+ready_event = threading.Event()
+
 
 # ============================================================
 # REQUEST MODELS
@@ -104,7 +111,7 @@ class ProposeTradeRequest(BaseModel):
     ticker: str = Field(..., min_length=1, max_length=50)
     title: str = Field(..., min_length=1, max_length=500)
     subtitle: str = Field(default="", max_length=200, description="Option name for multi-outcome markets")
-    side: Literal["YES", "NO"]
+    side: TradeSide
     limit_price: int = Field(..., ge=1, le=99)
     conviction: float = Field(..., ge=0.0, le=1.0)
     reasoning: str = Field(..., min_length=1, max_length=1000)
@@ -237,11 +244,10 @@ async def lifespan(app: FastAPI):
         # 3. Check if index needs population
         stats = app.state.llama_service.get_stats()
         if stats["count"] == 0:
-            logger.info("Index empty, fetching markets from Kalshi...")
-            all_markets = app.state.kalshi_client.get_all_markets(status="open")
-            logger.info(f"Indexing {len(all_markets)} markets...")
-            app.state.llama_service.index_markets(all_markets)
-            logger.info("Market index populated.")
+            logger.info("Index empty, fetching and indexing markets from Kalshi...")
+            # Pages are fetched in the background while earlier ones embed
+            count = app.state.llama_service.refresh_index(app.state.kalshi_client)
+            logger.info(f"Market index populated with {count} markets.")
         else:
             logger.info(f"Index loaded with {stats['count']} markets.")
 
@@ -259,6 +265,7 @@ async def lifespan(app: FastAPI):
         )
 
         app.state.initialized = True
+        ready_event.set()
         logger.info("All services initialized successfully.")
 
     except Exception as e:
@@ -270,6 +277,7 @@ async def lifespan(app: FastAPI):
     yield  # Application runs here
 
     # Cleanup
+    ready_event.clear()
     logger.info("Shutting down server...")
     if hasattr(app.state, 'kalshi_client') and app.state.kalshi_client:
         # Cleanup if needed
@@ -399,6 +407,17 @@ async def health_check(request: Request):
     )
 
 
+@app.api_route("/ready", methods=["GET", "HEAD"], include_in_schema=False)
+async def ready_check():
+    """Readiness probe for startup polling.
+
+    Status code only, no body: 204 once services are initialized, 503
+    before that (or if initialization failed). Unlike /health this
+    never calls out to Kalshi, so it is cheap to poll.
+    """
+    return Response(status_code=204 if ready_event.is_set() else 503)
+
+
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
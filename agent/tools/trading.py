@@ -13,10 +13,10 @@ The agent CANNOT execute trades without explicit user approval.
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Literal
+from typing import Optional
 
 from config import settings
-from models import TradeProposal, ExecutedTrade, Position
+from models import TradeProposal, ExecutedTrade, Position, TradeSide
 from services.kalshi_client import KalshiClient, KalshiError
 from agent.security.ghost_token import (
     GhostTokenValidator,
@@ -142,7 +142,7 @@ def calculate_position_size(
 async def propose_trade(
     ticker: str,
     title: str,
-    side: Literal["YES", "NO"],
+    side: TradeSide,
     limit_price: int,
     conviction: float,
     reasoning: str,
@@ -257,7 +257,8 @@ async def propose_trade(
         reasoning=reasoning,
         created_at=now,
         expires_at=expires_at,
-        close_time=close_time
+        close_time=close_time,
+        close_time_str=close_time.strftime("%b %d, %Y") if close_time else ""
     )
 
     # Register with ghost token validator
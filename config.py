@@ -1,6 +1,7 @@
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 
 class Settings(BaseSettings):
@@ -19,6 +20,9 @@ class Settings(BaseSettings):
     kalshi_private_key: str = ""  # Private key content (PEM) - alternative to file path
     kalshi_demo_mode: bool = True  # Use demo API (fake money) by default
 
+    # Parsed private key, filled in by load_private_key()
+    _private_key: Any = PrivateAttr(default=None)
+
     @property
     def kalshi_api_host(self) -> str:
         """Get Kalshi API host based on demo_mode setting."""
@@ -31,6 +35,9 @@ class Settings(BaseSettings):
     openai_api_key: str = ""  # Optional - only needed if not using HuggingFace embeddings
     groq_api_key: str = ""  # Free alternative - get key at https://console.groq.com
 
+    # Embeddings
+    embed_backend: str = "torch"  # "onnx" for faster CPU inference (needs optimum[onnxruntime])
+
     # Optional Services (for future features)
     tavily_api_key: str = ""
     elevenlabs_api_key: str = ""
@@ -99,6 +106,43 @@ class Settings(BaseSettings):
 
         return key_bytes
 
+    def load_private_key(self) -> Any:
+        """Load and parse the Kalshi private key, once per process.
+
+        The parsed key is cached on the settings instance, so the
+        environment check and every KalshiClient share a single PEM parse.
+
+        Returns:
+            The parsed cryptography private key object
+
+        Raises:
+            FileNotFoundError: If key file doesn't exist and no env var set
+            ValueError: If key is empty, invalid, can't be parsed, or is
+                not an RSA key
+        """
+        if self._private_key is None:
+            from cryptography.hazmat.primitives import serialization
+            from cryptography.hazmat.primitives.asymmetric import rsa
+
+            try:
+                key = serialization.load_pem_private_key(
+                    self.get_private_key(),
+                    password=None
+                )
+            except TypeError as e:
+                # Raised for password-protected keys
+                raise ValueError(f"Cannot load Kalshi private key: {e}") from e
+
+            # Kalshi only accepts RSA-PSS signatures; catch an Ed25519/EC
+            # key here rather than on the first signed request
+            if not isinstance(key, rsa.RSAPrivateKey):
+                raise ValueError(
+                    f"Kalshi private key must be RSA, got {type(key).__name__}.\n"
+                    f"Generate one at: https://kalshi.com/account/api"
+                )
+            self._private_key = key
+        return self._private_key
+
 
 # Singleton instance - import this in other modules
 # Will fail fast if required env vars are missing
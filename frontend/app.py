@@ -25,10 +25,11 @@ import os
 import re
 import time
 import uuid
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, AsyncIterator
 from datetime import datetime
 
 import gradio as gr
+import orjson
 
 from config import settings
 from models import (
@@ -37,13 +38,19 @@ from models import (
     TradeProposal,
     ExecutedTrade,
     Position,
+    MarketMatchListAdapter,
+    PositionListAdapter,
 )
 from frontend.components.trade_card import (
     render_trade_card_html,
+    render_countdown_html,
+    forget_trade_card,
     render_executed_trade_html,
     render_error_card_html,
     render_expired_card_html,
     generate_ghost_token,
+    calculate_time_remaining,
+    TRADE_CARD_CSS,
 )
 from frontend.components.portfolio_view import (
     render_portfolio_html,
@@ -55,6 +62,82 @@ from frontend.components.portfolio_view import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ============================================================
+# STATIC CONTENT
+# ============================================================
+
+_HEADER_MD = """
+# Kalshi Alpha Agent
+
+Convert your convictions into trades on Kalshi prediction markets.
+
+**How it works:**
+1. Express your belief (e.g., "I think Bitcoin will hit $100k")
+2. Review the markets I find
+3. Select a market to trade
+4. Approve or reject the proposed trade
+
+*Every trade requires your explicit approval. I will never trade without your consent.*
+"""
+
+_FOOTER_MD = """
+---
+*Kalshi Alpha Agent - Built for the MCP 1st Birthday Hackathon*
+
+**Security Note:** Trade approvals use one-time ghost tokens generated
+when you click APPROVE. The agent cannot execute trades without your
+explicit action.
+"""
+
+_CSS = """
+.container { max-width: 1200px; margin: auto; }
+.chat-container { min-height: 400px; }
+.trade-card-container { margin: 20px 0; }
+footer { display: none !important; }
+"""
+
+_EMPTY_TRADE_CARD_HTML = (
+    "<div style='color: #64748b; text-align: center; padding: 20px;'>"
+    "Express a belief above to generate a trade proposal</div>"
+)
+
+_MARKET_STATUS_HTML = (
+    "<div style='color: #64748b; padding: 10px; text-align: center;'>"
+    "Market index loaded</div>"
+)
+
+_PORTFOLIO_ERROR_TEMPLATE = """
+<div style="
+    background: #1e293b;
+    border: 1px solid #ef4444;
+    border-radius: 8px;
+    padding: 20px;
+    text-align: center;
+    color: #fca5a5;
+">
+    Failed to load portfolio: {error}
+</div>
+"""
+
+_REFRESH_UNAVAILABLE_HTML = """
+<div style="color: #fbbf24; padding: 10px; background: #1e293b; border-radius: 8px;">
+    Market refresh only available in standalone mode
+</div>
+"""
+
+_REFRESH_DONE_TEMPLATE = """
+<div style="color: #22c55e; padding: 10px; background: #1e293b; border-radius: 8px; text-align: center;">
+    Refreshed {count:,} markets
+</div>
+"""
+
+_REFRESH_FAILED_TEMPLATE = """
+<div style="color: #ef4444; padding: 10px; background: #1e293b; border-radius: 8px;">
+    Failed to refresh: {error}
+</div>
+"""
+
+
 # ============================================================
 # SERVICE MODE DETECTION
 # ============================================================
@@ -172,34 +255,34 @@ if STANDALONE_MODE:
 # SERVICE CALLS (STANDALONE OR API)
 # ============================================================
 
-def call_analyze_conviction(statement: str) -> Dict[str, Any]:
+async def call_analyze_conviction(statement: str) -> Dict[str, Any]:
     """Analyze conviction - direct or via API."""
     if STANDALONE_MODE:
-        result = asyncio.run(_analyze_conviction(statement))
+        result = await _analyze_conviction(statement)
         return result.model_dump()
     else:
-        return _api_call("POST", "/tools/analyze_conviction", {"statement": statement})
+        return await _api_call("POST", "/tools/analyze_conviction", {"statement": statement})
 
 
-def call_search_markets(query: str, n_results: int = 5) -> List[Dict[str, Any]]:
+async def call_search_markets(query: str, n_results: int = 5) -> List[Dict[str, Any]]:
     """Search markets - direct or via API."""
     if STANDALONE_MODE:
-        results = asyncio.run(_search_markets(query, n_results=n_results))
+        results = await _search_markets(query, n_results=n_results)
         return [r.model_dump() for r in results]
     else:
-        return _api_call("POST", "/tools/search_markets", {"query": query, "n_results": n_results})
+        return await _api_call("POST", "/tools/search_markets", {"query": query, "n_results": n_results})
 
 
-def call_get_market_details(ticker: str) -> Dict[str, Any]:
+async def call_get_market_details(ticker: str) -> Dict[str, Any]:
     """Get market details - direct or via API."""
     if STANDALONE_MODE:
-        result = asyncio.run(_get_market_details(ticker))
+        result = await _get_market_details(ticker)
         return result.model_dump()
     else:
-        return _api_call("POST", "/tools/get_market_details", {"ticker": ticker})
+        return await _api_call("POST", "/tools/get_market_details", {"ticker": ticker})
 
 
-def call_propose_trade(
+async def call_propose_trade(
     ticker: str,
     title: str,
     side: str,
@@ -211,17 +294,15 @@ def call_propose_trade(
 ) -> Dict[str, Any]:
     """Propose trade - direct or via API."""
     if STANDALONE_MODE:
-        result = asyncio.run(
-            _propose_trade(
-                ticker=ticker,
-                title=title,
-                side=side,
-                limit_price=limit_price,
-                conviction=conviction,
-                reasoning=reasoning,
-                close_time=close_time,
-                subtitle=subtitle
-            )
+        result = await _propose_trade(
+            ticker=ticker,
+            title=title,
+            side=side,
+            limit_price=limit_price,
+            conviction=conviction,
+            reasoning=reasoning,
+            close_time=close_time,
+            subtitle=subtitle
         )
         return result.model_dump()
     else:
@@ -236,37 +317,35 @@ def call_propose_trade(
         }
         if close_time:
             data["close_time"] = close_time.isoformat()
-        return _api_call("POST", "/tools/propose_trade", data)
+        return await _api_call("POST", "/tools/propose_trade", data)
 
 
-def call_execute_trade(trade_id: str, token: str, timestamp: int) -> Dict[str, Any]:
+async def call_execute_trade(trade_id: str, token: str, timestamp: int) -> Dict[str, Any]:
     """Execute trade - direct or via API."""
     if STANDALONE_MODE:
-        result = asyncio.run(
-            _execute_trade(trade_id=trade_id, token=token, timestamp=timestamp)
-        )
+        result = await _execute_trade(trade_id=trade_id, token=token, timestamp=timestamp)
         return result.model_dump()
     else:
-        return _api_call("POST", "/tools/execute_trade", {
+        return await _api_call("POST", "/tools/execute_trade", {
             "trade_id": trade_id,
             "token": token,
             "timestamp": timestamp
         })
 
 
-def call_cancel_proposal(trade_id: str) -> Dict[str, Any]:
+async def call_cancel_proposal(trade_id: str) -> Dict[str, Any]:
     """Cancel proposal - direct or via API."""
     if STANDALONE_MODE:
-        result = asyncio.run(_cancel_proposal(trade_id))
+        result = await _cancel_proposal(trade_id)
         return {"success": result, "trade_id": trade_id}
     else:
-        return _api_call("POST", "/tools/cancel_proposal", {"trade_id": trade_id})
+        return await _api_call("POST", "/tools/cancel_proposal", {"trade_id": trade_id})
 
 
-def call_get_portfolio() -> Dict[str, Any]:
+async def call_get_portfolio() -> Dict[str, Any]:
     """Get portfolio - direct or via API."""
     if STANDALONE_MODE:
-        positions = asyncio.run(_get_portfolio())
+        positions = await _get_portfolio()
         total_value = sum(p.current_value for p in positions) if positions else 0.0
         total_pnl = sum(p.unrealized_pnl for p in positions) if positions else 0.0
         return {
@@ -275,49 +354,103 @@ def call_get_portfolio() -> Dict[str, Any]:
             "total_pnl": round(total_pnl, 2)
         }
     else:
-        return _api_call("GET", "/tools/portfolio")
+        return await _api_call("GET", "/tools/portfolio")
 
 
-def call_get_balance() -> Dict[str, Any]:
+async def call_get_balance() -> Dict[str, Any]:
     """Get balance - direct or via API."""
     if STANDALONE_MODE:
-        balance = asyncio.run(_get_balance())
+        balance = await _get_balance()
         pending = _get_pending_trades_count()
         return {"available_usd": round(balance, 2), "pending_trades": pending}
     else:
-        return _api_call("GET", "/tools/balance")
+        return await _api_call("GET", "/tools/balance")
 
 
 # ============================================================
 # API CLIENT (FALLBACK FOR NON-STANDALONE MODE)
 # ============================================================
 
-def _api_call(method: str, endpoint: str, json_data: Optional[Dict] = None) -> Dict[str, Any]:
-    """Make HTTP call to backend API."""
-    import httpx
+def _load_result(model_cls, data: Dict[str, Any]):
+    """Rebuild a model from a service call result.
 
-    API_BASE = f"http://localhost:{settings.port}"
-    API_TIMEOUT = 30.0
+    Standalone results are model_dump() output of already-validated models,
+    so validation is skipped. API responses are JSON and still go through
+    validation to coerce ISO datetimes back into datetime objects.
+    """
+    if STANDALONE_MODE:
+        return model_cls.model_construct(**data)
+    return model_cls(**data)
 
-    with httpx.Client(timeout=API_TIMEOUT) as client:
-        url = f"{API_BASE}{endpoint}"
 
-        if method == "GET":
-            response = client.get(url)
-        else:
-            response = client.post(url, json=json_data)
+_LIST_ADAPTERS = {
+    MarketMatch: MarketMatchListAdapter,
+    Position: PositionListAdapter,
+}
 
-        if response.status_code >= 400:
-            error_detail = response.json().get("detail", response.text)
-            raise Exception(f"API Error ({response.status_code}): {error_detail}")
 
-        return response.json()
+def _load_results(model_cls, items: List[Dict[str, Any]]) -> list:
+    """Rebuild a list of models from a service call result.
+
+    Same rules as _load_result; API responses are validated as a whole
+    list through the model's prebuilt TypeAdapter.
+    """
+    if STANDALONE_MODE:
+        return [model_cls.model_construct(**data) for data in items]
+    return _LIST_ADAPTERS[model_cls].validate_python(items)
+
+
+_api_client = None
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _get_api_client():
+    """Get the shared async HTTP client for the backend API (lazy init)."""
+    global _api_client
+    if _api_client is None:
+        import httpx
+        _api_client = httpx.AsyncClient(
+            base_url=f"http://localhost:{settings.port}",
+            timeout=30.0,
+        )
+    return _api_client
+
+
+async def _api_call(method: str, endpoint: str, json_data: Optional[Dict] = None) -> Dict[str, Any]:
+    """Make HTTP call to backend API."""
+    client = _get_api_client()
+
+    if method == "GET":
+        response = await client.get(endpoint)
+    else:
+        # orjson encodes straight to bytes (and handles datetimes natively)
+        response = await client.post(
+            endpoint,
+            content=orjson.dumps(json_data),
+            headers=_JSON_HEADERS,
+        )
+
+    # Parse straight from bytes, skipping the str decode response.json() does
+    if response.status_code >= 400:
+        try:
+            error_detail = orjson.loads(response.content).get("detail", response.text)
+        except (orjson.JSONDecodeError, AttributeError):
+            error_detail = response.text
+        raise Exception(f"API Error ({response.status_code}): {error_detail}")
+
+    return orjson.loads(response.content)
 
 
 # ============================================================
 # STATE MANAGEMENT
 # ============================================================
 
+# Live AppState per browser session. Handlers mutate these in place instead
+# of rebuilding every model from the gr.State dict on each event; the dict
+# is still returned to Gradio as the fallback after a restart.
+_session_states: Dict[str, "AppState"] = {}
+
+
 class AppState:
     """Application state container."""
 
@@ -348,20 +481,48 @@ class AppState:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "AppState":
-        """Deserialize state from dict."""
+        """Deserialize state from dict.
+
+        The dict is our own to_dict() output, so models are rebuilt with
+        model_construct() instead of being validated again.
+        """
         state = cls()
         if data.get("conviction"):
-            state.current_conviction = ConvictionExtraction(**data["conviction"])
+            state.current_conviction = ConvictionExtraction.model_construct(**data["conviction"])
         if data.get("markets"):
-            state.available_markets = [MarketMatch(**m) for m in data["markets"]]
+            state.available_markets = [MarketMatch.model_construct(**m) for m in data["markets"]]
         if data.get("selected_market"):
-            state.selected_market = MarketMatch(**data["selected_market"])
+            state.selected_market = MarketMatch.model_construct(**data["selected_market"])
         if data.get("proposal"):
-            state.current_proposal = TradeProposal(**data["proposal"])
+            state.current_proposal = TradeProposal.model_construct(**data["proposal"])
         if data.get("last_executed"):
-            state.last_executed = ExecutedTrade(**data["last_executed"])
+            state.last_executed = ExecutedTrade.model_construct(**data["last_executed"])
         return state
 
+    @classmethod
+    def for_session(cls, data: Optional[Dict], session_id: Optional[str] = None) -> "AppState":
+        """Get the live state for a session, deserializing only on first use.
+
+        Args:
+            data: Serialized state from gr.State
+            session_id: Gradio session hash (None disables caching)
+
+        Returns:
+            The session's AppState
+        """
+        state = _session_states.get(session_id) if session_id else None
+        if state is None:
+            state = cls.from_dict(data) if data else cls()
+            if session_id:
+                _session_states[session_id] = state
+        return state
+
+    @staticmethod
+    def drop_session(session_id: Optional[str]):
+        """Forget a session's live state (called when the browser tab closes)."""
+        if session_id:
+            _session_states.pop(session_id, None)
+
 
 # ============================================================
 # CHAT HANDLERS
@@ -457,6 +618,16 @@ def format_multi_outcome_options(event_markets: List[MarketMatch], max_options:
     return "\n".join(lines)
 
 
+# Chat message templates for format_markets_message()
+_MARKETS_HEADER = "**Markets Found:**\n"
+_MARKET_TEMPLATE = "**{num}. {title}**\n   {interpretation} | Vol: {volume:,}\n"
+_EVENT_TEMPLATE = "**{num}. {title}**\n   Closes: {close_date} | Vol: {volume:,}{warning}\n{options}\n"
+_BOTTOM_LINE_EVENT = "\n**Bottom line:** See options above for market #1.\n"
+_BOTTOM_LINE_TEMPLATE = "\n**Bottom line:** Market #1 has **{yes_price}% odds** of YES.\n"
+_LOW_LIQUIDITY_WARNING = "\n**Warning:** Low liquidity - these odds may not reflect real market sentiment.\n"
+_SELECTION_PROMPT = "\n**Which market would you like to trade?** (Enter number)"
+
+
 def format_markets_message(markets: List[MarketMatch], kalshi_client=None) -> str:
     """Format markets list as a chat message with interpretation.
 
@@ -465,15 +636,17 @@ def format_markets_message(markets: List[MarketMatch], kalshi_client=None) -> st
     if not markets:
         return "I couldn't find any relevant markets. Try rephrasing your belief."
 
-    lines = ["**Markets Found:**\n"]
+    blocks = [_MARKETS_HEADER]
 
     # Track which event_tickers we've already displayed to avoid duplicates
     shown_events = set()
     display_num = 0
 
     for market in markets:
+        multi_outcome = is_multi_outcome_market(market)
+
         # Check if this is a multi-outcome market
-        if is_multi_outcome_market(market):
+        if multi_outcome:
             # Skip if we've already shown this event
             if market.event_ticker in shown_events:
                 continue
@@ -490,24 +663,23 @@ def format_markets_message(markets: List[MarketMatch], kalshi_client=None) -> st
             if event_markets and len(event_markets) > 1:
                 # Multi-outcome: show all options
                 display_num += 1
-                close_date = market.close_time.strftime("%b %d, %Y")
                 total_volume = sum(m.volume for m in event_markets)
-                is_low_liquidity = total_volume < 2000
-
-                lines.append(f"**{display_num}. {market.title}**")
-                lines.append(f"   Closes: {close_date} | Vol: {total_volume:,}" +
-                           (" [LOW LIQUIDITY]" if is_low_liquidity else ""))
-                lines.append(format_multi_outcome_options(event_markets))
-                lines.append("")
+                blocks.append(_EVENT_TEMPLATE.format(
+                    num=display_num,
+                    title=market.title,
+                    close_date=market.close_time.strftime("%b %d, %Y"),
+                    volume=total_volume,
+                    warning=" [LOW LIQUIDITY]" if total_volume < 2000 else "",
+                    options=format_multi_outcome_options(event_markets),
+                ))
                 continue
 
         # Binary market (or couldn't fetch event)
         display_num += 1
-        interpretation = format_market_interpretation(market)
 
         # Build title with subtitle for multi-outcome markets
         title = market.title
-        if market.subtitle and is_multi_outcome_market(market):
+        if market.subtitle and multi_outcome:
             # Show option name for multi-outcome markets (e.g., "Who will win MVP? - LeBron James")
             title = f"{market.title} - **{market.subtitle}**"
         else:
@@ -516,33 +688,29 @@ def format_markets_message(markets: List[MarketMatch], kalshi_client=None) -> st
             if threshold and "$" not in title:
                 title = f"{title} (>{threshold})"
 
-        lines.append(
-            f"**{display_num}. {title}**\n"
-            f"   {interpretation} | Vol: {market.volume:,}\n"
-        )
+        blocks.append(_MARKET_TEMPLATE.format(
+            num=display_num,
+            title=title,
+            interpretation=format_market_interpretation(market),
+            volume=market.volume,
+        ))
 
     # Find first reliable market for summary
-    reliable_market = None
-    for m in markets:
-        is_reliable = m.volume >= 500 and not (m.yes_price == 50 and m.no_price == 50 and m.volume < 5000)
-        if is_reliable:
-            reliable_market = m
-            break
+    reliable_market = next(
+        (m for m in markets
+         if m.volume >= 500 and not (m.yes_price == 50 and m.no_price == 50 and m.volume < 5000)),
+        None
+    )
 
-    if reliable_market:
-        if is_multi_outcome_market(reliable_market):
-            lines.append(f"\n**Bottom line:** See options above for market #1.\n")
-        else:
-            lines.append(
-                f"\n**Bottom line:** Market #1 has **{reliable_market.yes_price}% odds** of YES.\n"
-            )
+    if reliable_market is None:
+        blocks.append(_LOW_LIQUIDITY_WARNING)
+    elif is_multi_outcome_market(reliable_market):
+        blocks.append(_BOTTOM_LINE_EVENT)
     else:
-        lines.append(
-            "\n**Warning:** Low liquidity - these odds may not reflect real market sentiment.\n"
-        )
+        blocks.append(_BOTTOM_LINE_TEMPLATE.format(yes_price=reliable_market.yes_price))
 
-    lines.append("\n**Which market would you like to trade?** (Enter number)")
-    return "\n".join(lines)
+    blocks.append(_SELECTION_PROMPT)
+    return "\n".join(blocks)
 
 
 def format_conviction_message(conviction: ConvictionExtraction) -> str:
@@ -563,28 +731,27 @@ def format_conviction_message(conviction: ConvictionExtraction) -> str:
     )
 
 
-def process_message(
+async def process_message(
     message: str,
     history: List[Dict[str, str]],
-    state_dict: Dict
-) -> Tuple[List[Dict[str, str]], Dict, str, bool, str, Optional[str]]:
+    state_dict: Dict,
+    session_id: Optional[str] = None
+) -> AsyncIterator[Tuple[List[Dict[str, str]], Dict, str, bool, str, Optional[str]]]:
     """Process user message and update state.
 
+    Yields intermediate results after each backend step so the chat shows
+    progress (thinking bubble, conviction, markets) while the next call runs.
+
     Args:
         message: User's input message
         history: Chat history (Gradio 6 messages format)
         state_dict: Serialized app state
+        session_id: Gradio session hash for the live state cache
 
-    Returns:
+    Yields:
         Tuple of (history, state_dict, trade_card_html, trade_card_visible, trade_id, selected_ticker)
     """
-    state = AppState.from_dict(state_dict) if state_dict else AppState()
-
-    # Default returns
-    trade_card_html = ""
-    trade_card_visible = False
-    trade_id = None
-    selected_ticker = None
+    state = AppState.for_session(state_dict, session_id)
 
     try:
         # Check if user is selecting a market
@@ -596,14 +763,15 @@ def process_message(
                 # Add to history (Gradio 6 messages format)
                 history.append({"role": "user", "content": message})
                 history.append({"role": "assistant", "content": f"Great choice! Getting fresh data for **{selected.title}**..."})
+                yield history, state_dict, "", False, None, None
 
                 # Get fresh market details
-                fresh_data = call_get_market_details(selected.ticker)
-                fresh_market = MarketMatch(**fresh_data)
+                fresh_data = await call_get_market_details(selected.ticker)
+                fresh_market = _load_result(MarketMatch, fresh_data)
                 state.selected_market = fresh_market
 
                 # Create trade proposal
-                proposal_data = call_propose_trade(
+                proposal_data = await call_propose_trade(
                     ticker=fresh_market.ticker,
                     title=fresh_market.title,
                     side=state.current_conviction.side,
@@ -613,7 +781,7 @@ def process_message(
                     close_time=fresh_market.close_time,
                     subtitle=fresh_market.subtitle
                 )
-                proposal = TradeProposal(**proposal_data)
+                proposal = _load_result(TradeProposal, proposal_data)
                 state.current_proposal = proposal
 
                 # Update history with proposal message (replace last assistant message)
@@ -625,44 +793,42 @@ def process_message(
 
                 # Show trade card
                 trade_card_html = render_trade_card_html(proposal)
-                trade_card_visible = True
-                trade_id = proposal.trade_id
+                logger.debug(f"Trade proposal created: {proposal.trade_id}")
 
-                # Debug logging
-                print(f"[DEBUG] Trade proposal created: {trade_id}")
-                print(f"[DEBUG] HTML length: {len(trade_card_html)} chars")
-                print(f"[DEBUG] Visible: {trade_card_visible}")
-
-                return history, state.to_dict(), trade_card_html, trade_card_visible, trade_id, None
+                yield history, state.to_dict(), trade_card_html, True, proposal.trade_id, None
+                return
 
         # Regular message - analyze conviction
         history.append({"role": "user", "content": message})
         history.append({"role": "assistant", "content": "Analyzing your statement..."})
+        yield history, state_dict, "", False, None, None
 
         # Call conviction analysis
-        conviction_data = call_analyze_conviction(message)
+        conviction_data = await call_analyze_conviction(message)
         conviction = ConvictionExtraction(**conviction_data)
         state.current_conviction = conviction
 
         if not conviction.has_trading_intent:
             history[-1] = {"role": "assistant", "content": format_conviction_message(conviction)}
             state.reset()
-            return history, state.to_dict(), "", False, None, None
+            yield history, state.to_dict(), "", False, None, None
+            return
 
         # Update with conviction analysis
         history[-1] = {"role": "assistant", "content": format_conviction_message(conviction)}
+        yield history, state_dict, "", False, None, None
 
         # Search for markets
         search_query = " ".join(conviction.keywords) if conviction.keywords else conviction.topic
-        markets_data = call_search_markets(search_query, n_results=5)
-        markets = [MarketMatch(**m) for m in markets_data]
+        markets_data = await call_search_markets(search_query, n_results=5)
+        markets = _load_results(MarketMatch, markets_data)
         state.available_markets = markets
 
         # Add markets message (pass kalshi_client for multi-outcome market expansion)
         kalshi = _kalshi_client if STANDALONE_MODE else None
         history.append({"role": "assistant", "content": format_markets_message(markets, kalshi_client=kalshi)})
 
-        return history, state.to_dict(), "", False, None, None
+        yield history, state.to_dict(), "", False, None, None
 
     except Exception as e:
         error_msg = f"Sorry, an error occurred: {str(e)}"
@@ -671,7 +837,63 @@ def process_message(
         else:
             history.append({"role": "user", "content": message})
             history.append({"role": "assistant", "content": error_msg})
-        return history, state.to_dict() if state else {}, "", False, None, None
+        yield history, state.to_dict() if state else {}, "", False, None, None
+
+
+# Max chat re-render rate for streamed updates (seconds between yields)
+_STREAM_INTERVAL = 0.05
+
+
+async def _throttle(updates: AsyncIterator, interval: float = _STREAM_INTERVAL) -> AsyncIterator:
+    """Coalesce a stream of UI updates to at most one per `interval`.
+
+    Each yield re-renders the whole chatbot, so updates arriving faster
+    than the interval are collapsed and only the most recent one is sent.
+    A held-back update is flushed when its deadline passes even if the
+    source is still busy, and the final update is always delivered.
+
+    Args:
+        updates: Async iterator of handler output tuples
+        interval: Minimum seconds between yielded updates
+
+    Yields:
+        The latest update at most once per interval
+    """
+    loop = asyncio.get_running_loop()
+    source = updates.__aiter__()
+    pending = None
+    has_pending = False
+    last_sent = float("-inf")
+    next_item = asyncio.ensure_future(source.__anext__())
+
+    try:
+        while True:
+            timeout = max(0.0, last_sent + interval - loop.time()) if has_pending else None
+            done, _ = await asyncio.wait({next_item}, timeout=timeout)
+
+            if not done:
+                # Deadline hit while the source is still working: flush
+                yield pending
+                has_pending = False
+                last_sent = loop.time()
+                continue
+
+            try:
+                item = next_item.result()
+            except StopAsyncIteration:
+                if has_pending:
+                    yield pending
+                return
+            next_item = asyncio.ensure_future(source.__anext__())
+
+            if loop.time() - last_sent >= interval:
+                yield item
+                has_pending = False
+                last_sent = loop.time()
+            else:
+                pending, has_pending = item, True
+    finally:
+        next_item.cancel()
 
 
 def parse_market_selection(
@@ -715,10 +937,11 @@ def parse_market_selection(
 # TRADE ACTION HANDLERS
 # ============================================================
 
-def handle_approve(
+async def handle_approve(
     trade_id: str,
     state_dict: Dict,
-    history: List[Dict[str, str]]
+    history: List[Dict[str, str]],
+    session_id: Optional[str] = None
 ) -> Tuple[List[Dict[str, str]], Dict, str, bool, str]:
     """Handle trade approval button click.
 
@@ -728,11 +951,12 @@ def handle_approve(
         trade_id: The proposal trade ID
         state_dict: Current app state
         history: Chat history (Gradio 6 messages format)
+        session_id: Gradio session hash for the live state cache
 
     Returns:
         Tuple of (history, state_dict, trade_card_html, visible, trade_id)
     """
-    state = AppState.from_dict(state_dict) if state_dict else AppState()
+    state = AppState.for_session(state_dict, session_id)
 
     if not trade_id or not state.current_proposal:
         return history, state.to_dict(), render_error_card_html("No active proposal"), True, None
@@ -742,11 +966,12 @@ def handle_approve(
         token, timestamp = generate_ghost_token()
 
         # Execute trade with ghost token
-        result_data = call_execute_trade(trade_id, token, timestamp)
+        result_data = await call_execute_trade(trade_id, token, timestamp)
 
-        executed = ExecutedTrade(**result_data)
+        executed = _load_result(ExecutedTrade, result_data)
         state.last_executed = executed
         state.current_proposal = None
+        forget_trade_card(trade_id)
 
         # Update history
         history.append({
@@ -762,6 +987,9 @@ def handle_approve(
         state.selected_market = None
         state.current_conviction = None
 
+        # Push the new position to every open portfolio view
+        _spawn(publish_portfolio())
+
         return history, state.to_dict(), render_executed_trade_html(executed), True, None
 
     except Exception as e:
@@ -769,15 +997,17 @@ def handle_approve(
 
         # Check for specific error types
         if "expired" in error_msg.lower() or "ttl" in error_msg.lower():
+            forget_trade_card(trade_id)
             return history, state.to_dict(), render_expired_card_html(), True, None
 
         return history, state.to_dict(), render_error_card_html(error_msg), True, None
 
 
-def handle_reject(
+async def handle_reject(
     trade_id: str,
     state_dict: Dict,
-    history: List[Dict[str, str]]
+    history: List[Dict[str, str]],
+    session_id: Optional[str] = None
 ) -> Tuple[List[Dict[str, str]], Dict, str, bool, str]:
     """Handle trade rejection button click.
 
@@ -785,21 +1015,23 @@ def handle_reject(
         trade_id: The proposal trade ID
         state_dict: Current app state
         history: Chat history (Gradio 6 messages format)
+        session_id: Gradio session hash for the live state cache
 
     Returns:
         Tuple of (history, state_dict, trade_card_html, visible, trade_id)
     """
-    state = AppState.from_dict(state_dict) if state_dict else AppState()
+    state = AppState.for_session(state_dict, session_id)
 
     if trade_id:
         try:
-            call_cancel_proposal(trade_id)
+            await call_cancel_proposal(trade_id)
         except Exception:
             pass  # Ignore cancellation errors
 
     # Reset proposal state
     state.current_proposal = None
     state.selected_market = None
+    forget_trade_card(trade_id)
 
     # Add message
     history.append({
@@ -816,40 +1048,196 @@ def handle_reject(
 # PORTFOLIO HANDLERS
 # ============================================================
 
-def fetch_portfolio() -> str:
-    """Fetch and render portfolio data."""
+# Refreshes that land within this window share one backend fetch
+_COALESCE_WINDOW = 0.25
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def _coalesced(key: str, fetch):
+    """Run fetch() once for all callers asking for `key` at the same time.
+
+    Callers that arrive while a fetch is in flight, or within
+    _COALESCE_WINDOW seconds after it finished, get the same result
+    (or exception) instead of firing another backend request.
+
+    The fetch runs as its own task, which every caller awaits through
+    asyncio.shield: a caller that is cancelled stops waiting without
+    cancelling the fetch the others are waiting on.
+
+    Args:
+        key: Name of the shared request (e.g. "portfolio")
+        fetch: Zero-argument coroutine function doing the real call
+
+    Returns:
+        The fetch result
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _inflight[key] = task
+
+        def _finished(done: asyncio.Task) -> None:
+            if not done.cancelled():
+                done.exception()  # Mark retrieved even if every caller left
+            done.get_loop().call_later(_COALESCE_WINDOW, _forget, key, done)
+
+        task.add_done_callback(_finished)
+    return await asyncio.shield(task)
+
+
+def _forget(key: str, task: asyncio.Task) -> None:
+    """Drop a finished fetch from _inflight unless it was already replaced."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+
+
+async def fetch_portfolio(partial: bool = True) -> AsyncIterator[str]:
+    """Fetch and render portfolio data.
+
+    Balance and positions are requested concurrently. The balance call
+    usually returns first, so a compact balance view is yielded as soon
+    as it arrives, followed by the full portfolio render.
+
+    Args:
+        partial: Whether to yield the early balance-only view
+
+    Yields:
+        Portfolio HTML; the last item is always the complete view (or error)
+    """
+    balance_task = asyncio.ensure_future(_coalesced("balance", call_get_balance))
+    portfolio_task = asyncio.ensure_future(_coalesced("portfolio", call_get_portfolio))
     try:
+        # Fetch balance
+        balance_data = await balance_task
+        balance = balance_data.get("available_usd", 0.0)
+        if partial and not portfolio_task.done():
+            yield render_balance_html(balance)
+
         # Fetch portfolio
-        portfolio_data = call_get_portfolio()
-        positions = [Position(**p) for p in portfolio_data.get("positions", [])]
+        portfolio_data = await portfolio_task
+        positions = _load_results(Position, portfolio_data.get("positions", []))
         total_value = portfolio_data.get("total_value", 0.0)
         total_pnl = portfolio_data.get("total_pnl", 0.0)
 
-        # Fetch balance
-        balance_data = call_get_balance()
-        balance = balance_data.get("available_usd", 0.0)
-
-        return render_portfolio_html(positions, total_value, total_pnl, balance)
+        yield render_portfolio_html(positions, total_value, total_pnl, balance)
 
     except Exception as e:
-        return f"""
-        <div style="
-            background: #1e293b;
-            border: 1px solid #ef4444;
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-            color: #fca5a5;
-        ">
-            Failed to load portfolio: {str(e)}
-        </div>
-        """
+        yield _PORTFOLIO_ERROR_TEMPLATE.format(error=e)
+
+    finally:
+        # Fetches are shared with other sessions, so never cancel them;
+        # just make sure an abandoned one doesn't log an unretrieved error
+        for task in (balance_task, portfolio_task):
+            if not task.done():
+                task.add_done_callback(_discard_result)
+
+
+def _discard_result(task: asyncio.Future):
+    """Done-callback that retrieves and drops a task's outcome."""
+    if not task.cancelled():
+        task.exception()
+
+
+# Seconds after page load before the portfolio stream starts
+_PORTFOLIO_STREAM_DELAY = 0.5
+
+# Seconds between manual "Refresh Portfolio" clicks that hit the backend
+_PORTFOLIO_REFRESH_COOLDOWN = 30.0
+
+# One queue per open portfolio view; publish_portfolio() fans out to all
+_portfolio_subscribers: set = set()
+_background_tasks: set = set()
+
+
+def _spawn(coro):
+    """Run a coroutine in the background, keeping a reference until done."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+# Hash of the portfolio HTML each session last received, so identical
+# renders are not pushed to the browser again
+_portfolio_shown: Dict[str, int] = {}
+
+
+def _portfolio_changed(session_id: Optional[str], html: str) -> bool:
+    """Record html as shown to the session; False if it is already on screen."""
+    if not session_id:
+        return True
+    digest = hash(html)
+    if _portfolio_shown.get(session_id) == digest:
+        return False
+    _portfolio_shown[session_id] = digest
+    return True
+
+
+async def publish_portfolio():
+    """Fetch the portfolio once and push it to every subscribed session."""
+    if not _portfolio_subscribers:
+        return
+    # Push only the complete render; a balance-only flash would replace
+    # a portfolio view that is already on screen
+    async for html in fetch_portfolio(partial=False):
+        pass
+    for queue in list(_portfolio_subscribers):
+        # Only the latest snapshot matters; drop one the view hasn't shown yet
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(html)
+
+
+async def portfolio_stream(session_id: Optional[str] = None) -> AsyncIterator[str]:
+    """Stream portfolio HTML to one browser session.
+
+    Yields an initial snapshot on connect, then a fresh render whenever
+    publish_portfolio() runs (e.g. after a trade executes). Renders
+    identical to what the session already shows are not sent.
+
+    Args:
+        session_id: Gradio session hash of the subscribing browser tab
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    _portfolio_subscribers.add(queue)
+    try:
+        async for html in fetch_portfolio(partial=session_id not in _portfolio_shown):
+            if _portfolio_changed(session_id, html):
+                yield html
+        while True:
+            html = await queue.get()
+            if _portfolio_changed(session_id, html):
+                yield html
+    finally:
+        _portfolio_subscribers.discard(queue)
+
+
+async def refresh_portfolio(
+    last_refresh: float,
+    session_id: Optional[str] = None
+) -> AsyncIterator[Tuple[str, float]]:
+    """Manual portfolio refresh, rate limited per session.
+
+    Args:
+        last_refresh: time.monotonic() of this session's last manual refresh (0 if none)
+        session_id: Gradio session hash, used to skip unchanged renders
+
+    Yields:
+        Tuples of (portfolio_html, last_refresh); portfolio_html is gr.skip()
+        while the cooldown is active or nothing changed
+    """
+    now = time.monotonic()
+    if last_refresh and now - last_refresh < _PORTFOLIO_REFRESH_COOLDOWN:
+        yield gr.skip(), last_refresh
+        return
+    async for html in fetch_portfolio(partial=session_id not in _portfolio_shown):
+        yield (html if _portfolio_changed(session_id, html) else gr.skip()), now
 
 
-def fetch_balance() -> str:
+async def fetch_balance() -> str:
     """Fetch and render balance."""
     try:
-        data = call_get_balance()
+        data = await _coalesced("balance", call_get_balance)
         return render_balance_html(
             balance=data.get("available_usd", 0.0),
             pending_trades=data.get("pending_trades", 0)
@@ -858,39 +1246,132 @@ def fetch_balance() -> str:
         return render_balance_html(0.0, 0)
 
 
-def refresh_markets() -> str:
+async def refresh_markets() -> str:
     """Refresh market index by re-fetching from Kalshi API.
 
     Returns:
         Status message HTML
     """
     if not STANDALONE_MODE:
-        return """
-        <div style="color: #fbbf24; padding: 10px; background: #1e293b; border-radius: 8px;">
-            Market refresh only available in standalone mode
-        </div>
-        """
+        return _REFRESH_UNAVAILABLE_HTML
 
     try:
         logger.info("Refreshing market index...")
 
-        # Use the built-in refresh method which fetches and re-indexes
-        count = _llama_service.refresh_index(_kalshi_client)
+        # Use the built-in refresh method which fetches and re-indexes.
+        # This takes minutes, so keep it off the event loop.
+        count = await asyncio.to_thread(_llama_service.refresh_index, _kalshi_client)
         logger.info(f"Market index refreshed: {count} markets indexed")
 
-        return f"""
-        <div style="color: #22c55e; padding: 10px; background: #1e293b; border-radius: 8px; text-align: center;">
-            Refreshed {count:,} markets
-        </div>
-        """
+        return _REFRESH_DONE_TEMPLATE.format(count=count)
 
     except Exception as e:
         logger.error(f"Failed to refresh markets: {e}")
-        return f"""
-        <div style="color: #ef4444; padding: 10px; background: #1e293b; border-radius: 8px;">
-            Failed to refresh: {str(e)}
-        </div>
-        """
+        return _REFRESH_FAILED_TEMPLATE.format(error=e)
+
+
+# ============================================================
+# GRADIO EVENT HANDLERS
+# ============================================================
+# Defined at module level so the same functions serve every Blocks
+# instance; create_app only wires them to components.
+
+def _countdown_outputs(trade_id: Optional[str], session_id: Optional[str]) -> Tuple[str, gr.Timer]:
+    """Countdown HTML and timer state to go with a handler result.
+
+    The countdown ticks only while a proposal is pending (trade_id set).
+    """
+    state = _session_states.get(session_id) if session_id else None
+    proposal = state.current_proposal if state else None
+    if not trade_id or proposal is None:
+        return "", gr.Timer(active=False)
+    return render_countdown_html(proposal), gr.Timer(active=True)
+
+
+async def _on_submit(message, history, state, request: gr.Request):
+    """Handle message submission, streaming each step to the chat."""
+    if not message.strip():
+        # Nothing to do; leave every output (trade card included) untouched
+        yield tuple(gr.skip() for _ in range(8))
+        return
+
+    updates = process_message(message, history, state, request.session_hash)
+    async for result in _throttle(updates):
+        # result = (history, state_dict, trade_card_html, visible, trade_id, _)
+        yield (
+            result[0],  # history
+            result[1],  # state
+            result[2],  # trade_card_html content (string)
+            gr.update(visible=bool(result[3])),  # trade_buttons_row visibility
+            result[4],  # trade_id
+            "",  # clear msg_input
+            *_countdown_outputs(result[4], request.session_hash),
+        )
+
+
+async def _on_approve(trade_id, state, history, request: gr.Request):
+    """Handle approve button click."""
+    result = await handle_approve(trade_id, state, history, request.session_hash)
+    # result = (history, state_dict, trade_card_html, visible, trade_id)
+    visible = result[3]
+    return (
+        result[0],  # history
+        result[1],  # state
+        result[2],  # trade_card_html content (string)
+        gr.update(visible=bool(visible)),  # trade_buttons_row visibility
+        result[4],  # trade_id
+        *_countdown_outputs(result[4], request.session_hash),
+    )
+
+
+async def _on_reject(trade_id, state, history, request: gr.Request):
+    """Handle reject button click."""
+    result = await handle_reject(trade_id, state, history, request.session_hash)
+    # result = (history, state_dict, trade_card_html, visible, trade_id)
+    visible = result[3]
+    return (
+        result[0],  # history
+        result[1],  # state
+        result[2],  # trade_card_html content (string)
+        gr.update(visible=bool(visible)),  # trade_buttons_row visibility
+        result[4],  # trade_id
+        *_countdown_outputs(result[4], request.session_hash),
+    )
+
+
+async def _on_refresh_portfolio(last_refresh, request: gr.Request):
+    """Handle the Refresh Portfolio button."""
+    async for update in refresh_portfolio(last_refresh, request.session_hash):
+        yield update
+
+
+async def _on_load(request: gr.Request):
+    """Stream the portfolio view to a newly loaded page."""
+    async for html in portfolio_stream(request.session_hash):
+        yield html
+
+
+def _on_countdown_tick(request: gr.Request):
+    """Refresh the pending proposal's countdown; stop once it runs out."""
+    state = _session_states.get(request.session_hash)
+    proposal = state.current_proposal if state else None
+    if proposal is None:
+        return "", gr.Timer(active=False)
+    if calculate_time_remaining(proposal) <= 0:
+        forget_trade_card(proposal.trade_id)
+        return render_countdown_html(proposal), gr.Timer(active=False)
+    return render_countdown_html(proposal), gr.skip()
+
+
+def _stop_timer():
+    """Deactivate the timer that fired (used for one-shot timers)."""
+    return gr.Timer(active=False)
+
+
+async def _on_unload(request: gr.Request):
+    """Drop the session's live state when the tab closes."""
+    AppState.drop_session(request.session_hash)
+    _portfolio_shown.pop(request.session_hash, None)
 
 
 # ============================================================
@@ -908,21 +1389,10 @@ def create_app() -> gr.Blocks:
         # State
         app_state = gr.State(value={})
         current_trade_id = gr.State(value=None)
+        portfolio_refreshed_at = gr.State(value=0.0)
 
         # Header
-        gr.Markdown("""
-        # Kalshi Alpha Agent
-
-        Convert your convictions into trades on Kalshi prediction markets.
-
-        **How it works:**
-        1. Express your belief (e.g., "I think Bitcoin will hit $100k")
-        2. Review the markets I find
-        3. Select a market to trade
-        4. Approve or reject the proposed trade
-
-        *Every trade requires your explicit approval. I will never trade without your consent.*
-        """)
+        gr.Markdown(_HEADER_MD)
 
         with gr.Row():
             # Left column - Chat
@@ -947,7 +1417,11 @@ def create_app() -> gr.Blocks:
                 # Trade card section - HTML is always visible, buttons hidden until proposal
                 gr.Markdown("---")
                 gr.Markdown("### Trade Proposal")
-                trade_card_html = gr.HTML(value="<div style='color: #64748b; text-align: center; padding: 20px;'>Express a belief above to generate a trade proposal</div>")
+                # Card styling is supplied once here; cards use its classes
+                trade_card_html = gr.HTML(value=_EMPTY_TRADE_CARD_HTML, css_template=TRADE_CARD_CSS)
+                # Countdown is separate so its per-second updates don't resend the card
+                trade_countdown_html = gr.HTML(value="", padding=False, css_template=TRADE_CARD_CSS)
+                countdown_timer = gr.Timer(1.0, active=False)
                 with gr.Row(visible=False) as trade_buttons_row:
                     approve_btn = gr.Button(
                         "APPROVE",
@@ -978,9 +1452,7 @@ def create_app() -> gr.Blocks:
 
                 gr.Markdown("---")
                 gr.Markdown("### Market Index")
-                market_status_html = gr.HTML(
-                    value="<div style='color: #64748b; padding: 10px; text-align: center;'>Market index loaded</div>"
-                )
+                market_status_html = gr.HTML(value=_MARKET_STATUS_HTML)
                 refresh_markets_btn = gr.Button(
                     "Refresh Markets",
                     variant="secondary",
@@ -988,102 +1460,58 @@ def create_app() -> gr.Blocks:
                 )
 
         # Footer
-        gr.Markdown("""
-        ---
-        *Kalshi Alpha Agent - Built for the MCP 1st Birthday Hackathon*
-
-        **Security Note:** Trade approvals use one-time ghost tokens generated
-        when you click APPROVE. The agent cannot execute trades without your
-        explicit action.
-        """)
+        gr.Markdown(_FOOTER_MD)
 
         # ============================================================
-        # EVENT HANDLERS
+        # EVENT WIRING
         # ============================================================
 
-        def on_submit(message, history, state):
-            """Handle message submission."""
-            if not message.strip():
-                return history, state, "", gr.Row(visible=False), None
-
-            result = process_message(message, history, state)
-            # result = (history, state_dict, trade_card_html, visible, trade_id, _)
-            visible = result[3]
-            html_content = result[2]
-
-            # Debug logging
-            print(f"[DEBUG on_submit] visible={visible}, html_len={len(html_content) if html_content else 0}")
-
-            return (
-                result[0],  # history
-                result[1],  # state
-                html_content,  # trade_card_html content (string)
-                gr.Row(visible=visible),  # trade_buttons_row visibility
-                result[4],  # trade_id
-            )
-
-        def on_approve(trade_id, state, history):
-            """Handle approve button click."""
-            result = handle_approve(trade_id, state, history)
-            # result = (history, state_dict, trade_card_html, visible, trade_id)
-            visible = result[3]
-            return (
-                result[0],  # history
-                result[1],  # state
-                result[2],  # trade_card_html content (string)
-                gr.Row(visible=visible),  # trade_buttons_row visibility
-                result[4],  # trade_id
-            )
-
-        def on_reject(trade_id, state, history):
-            """Handle reject button click."""
-            result = handle_reject(trade_id, state, history)
-            # result = (history, state_dict, trade_card_html, visible, trade_id)
-            visible = result[3]
-            return (
-                result[0],  # history
-                result[1],  # state
-                result[2],  # trade_card_html content (string)
-                gr.Row(visible=visible),  # trade_buttons_row visibility
-                result[4],  # trade_id
-            )
-
         # Message submission
         msg_input.submit(
-            fn=on_submit,
+            fn=_on_submit,
             inputs=[msg_input, chatbot, app_state],
-            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id]
-        ).then(
-            fn=lambda: "",
-            outputs=msg_input
+            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id, msg_input,
+                     trade_countdown_html, countdown_timer],
+            concurrency_limit=None,
         )
 
         submit_btn.click(
-            fn=on_submit,
+            fn=_on_submit,
             inputs=[msg_input, chatbot, app_state],
-            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id]
-        ).then(
-            fn=lambda: "",
-            outputs=msg_input
+            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id, msg_input,
+                     trade_countdown_html, countdown_timer],
+            concurrency_limit=None,
         )
 
         # Trade actions
         approve_btn.click(
-            fn=on_approve,
+            fn=_on_approve,
             inputs=[current_trade_id, app_state, chatbot],
-            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id]
+            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id,
+                     trade_countdown_html, countdown_timer]
         )
 
         reject_btn.click(
-            fn=on_reject,
+            fn=_on_reject,
             inputs=[current_trade_id, app_state, chatbot],
-            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id]
+            outputs=[chatbot, app_state, trade_card_html, trade_buttons_row, current_trade_id,
+                     trade_countdown_html, countdown_timer]
+        )
+
+        # Proposal countdown (lightweight, so it bypasses the queue)
+        countdown_timer.tick(
+            fn=_on_countdown_tick,
+            outputs=[trade_countdown_html, countdown_timer],
+            queue=False
         )
 
-        # Portfolio refresh
+        # Portfolio refresh (manual fallback for the pushed updates)
         refresh_portfolio_btn.click(
-            fn=fetch_portfolio,
-            outputs=portfolio_html
+            fn=_on_refresh_portfolio,
+            inputs=portfolio_refreshed_at,
+            outputs=[portfolio_html, portfolio_refreshed_at],
+            concurrency_limit=20,
+            concurrency_id="portfolio"
         )
 
         # Markets refresh
@@ -1092,12 +1520,30 @@ def create_app() -> gr.Blocks:
             outputs=market_status_html
         )
 
-        # Load portfolio on start
-        app.load(
-            fn=fetch_portfolio,
-            outputs=portfolio_html
+        # Stream portfolio: snapshot, then pushed updates. Started from a
+        # one-shot timer shortly after page load rather than app.load, so
+        # tabs that are opened and closed right away never hit Kalshi.
+        # Long-lived per session, so it must not count against a limit.
+        portfolio_timer = gr.Timer(_PORTFOLIO_STREAM_DELAY)
+        portfolio_timer.tick(
+            fn=_stop_timer,
+            outputs=portfolio_timer,
+            queue=False
+        ).then(
+            fn=_on_load,
+            outputs=portfolio_html,
+            concurrency_limit=None
         )
 
+        # Drop the session's live state when the tab closes
+        app.unload(_on_unload)
+
+    # Configured here rather than in launch_app so every entry point
+    # (main.py, app.py on Spaces) gets the same queue. Handlers are async
+    # and network-bound, so several can run at once; the API is closed so
+    # trade approvals can't bypass the queue.
+    app.queue(default_concurrency_limit=10, max_size=64, api_open=False)
+
     return app
 
 
@@ -1108,14 +1554,6 @@ def launch_app(host: str = None, port: int = None):
         host: Host to bind to (default: settings.host)
         port: Port to bind to (default: settings.port + 1)
     """
-    # Gradio 6: App-level parameters (css, theme, js, head) moved from Blocks to launch()
-    css = """
-    .container { max-width: 1200px; margin: auto; }
-    .chat-container { min-height: 400px; }
-    .trade-card-container { margin: 20px 0; }
-    footer { display: none !important; }
-    """
-
     app = create_app()
     # Gradio 6: title can be set via head parameter or theme
     # show_api replaced with footer_links parameter
@@ -1123,7 +1561,8 @@ def launch_app(host: str = None, port: int = None):
         server_name=host or settings.host,
         server_port=port or settings.port + 1,
         share=False,
-        css=css,
+        # Gradio 6: App-level parameters (css, theme, js, head) moved from Blocks to launch()
+        css=_CSS,
         # Gradio 6: Use footer_links instead of show_api
         # footer_links=["gradio", "settings"],  # Omit "api" to hide API link
     )
@@ -5,11 +5,16 @@ Visual components for the Kalshi Alpha Agent interface.
 
 from frontend.components.trade_card import (
     render_trade_card_html,
+    render_countdown_html,
+    forget_trade_card,
     render_executed_trade_html,
+    render_trade_cards_html,
+    render_executed_trades_html,
     render_error_card_html,
     render_expired_card_html,
     generate_ghost_token,
     create_trade_card_component,
+    TRADE_CARD_CSS,
 )
 
 from frontend.components.portfolio_view import (
@@ -22,11 +27,16 @@ from frontend.components.portfolio_view import (
 __all__ = [
     # Trade card
     "render_trade_card_html",
+    "render_countdown_html",
+    "forget_trade_card",
     "render_executed_trade_html",
+    "render_trade_cards_html",
+    "render_executed_trades_html",
     "render_error_card_html",
     "render_expired_card_html",
     "generate_ghost_token",
     "create_trade_card_component",
+    "TRADE_CARD_CSS",
     # Portfolio
     "render_portfolio_html",
     "render_balance_html",
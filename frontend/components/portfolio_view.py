@@ -5,57 +5,21 @@ Displays current portfolio positions and account balance.
 Shows P&L for each position with color coding.
 """
 
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 import gradio as gr
 
+from frontend.components.minify import minify_html
 from models import Position
 
 
-def format_currency(amount: float, include_sign: bool = False) -> str:
-    """Format amount as USD currency."""
-    if include_sign:
-        if amount >= 0:
-            return f"+${amount:.2f}"
-        return f"-${abs(amount):.2f}"
-    return f"${abs(amount):.2f}"
-
-
-def format_pnl_color(pnl: float) -> str:
-    """Get color for P&L display."""
-    if pnl > 0:
-        return "#22c55e"  # green
-    elif pnl < 0:
-        return "#ef4444"  # red
-    return "#94a3b8"  # gray
-
-
-def render_position_row(position: Position) -> str:
-    """Render a single position as an HTML row.
-
-    Args:
-        position: The position to render
-
-    Returns:
-        HTML string for the position row
-    """
-    pnl_color = format_pnl_color(position.unrealized_pnl)
-    side_color = "#3b82f6" if position.side == "YES" else "#f97316"
-
-    # Calculate P&L percentage
-    cost_basis = position.cost_basis if position.cost_basis > 0 else (position.contracts * position.avg_price / 100)
-    pnl_pct = (position.unrealized_pnl / cost_basis * 100) if cost_basis > 0 else 0
+# ============================================================
+# STATIC HTML SHELLS
+# ============================================================
 
-    # Format resolution date
-    if position.close_time:
-        resolve_date = position.close_time.strftime("%b %d, %Y")
-    else:
-        resolve_date = "TBD"
-
-    # Calculate max payout if position wins (contracts pay $1 each)
-    max_payout = position.contracts  # $1 per contract if wins
-
-    return f"""
+_ROW_TMPL = minify_html("""
     <div style="
         background: #1e293b;
         border-radius: 8px;
@@ -65,10 +29,10 @@ def render_position_row(position: Position) -> str:
         <!-- Market Title & Position -->
         <div style="margin-bottom: 10px;">
             <div style="font-size: 14px; font-weight: 600; color: #f1f5f9; margin-bottom: 4px; line-height: 1.3;">
-                {position.title}
+                {title}
             </div>
             <div style="font-size: 12px; color: #64748b;">
-                Position: <span style="color: {side_color}; font-weight: 600;">{position.contracts} {position.side}</span>
+                Position: <span style="color: {side_color}; font-weight: 600;">{contracts} {side}</span>
                 &nbsp;|&nbsp; Resolves: <span style="color: #94a3b8;">{resolve_date}</span>
             </div>
         </div>
@@ -91,7 +55,7 @@ def render_position_row(position: Position) -> str:
             <div style="text-align: center;">
                 <div style="font-size: 11px; color: #64748b; margin-bottom: 2px;">Current Value</div>
                 <div style="font-size: 14px; font-weight: 500; color: #f1f5f9;">
-                    ${position.current_value:.2f}
+                    ${current_value:.2f}
                 </div>
             </div>
             <div style="text-align: center;">
@@ -112,45 +76,21 @@ def render_position_row(position: Position) -> str:
             border-top: 1px solid #334155;
         ">
             <div style="font-size: 12px; color: #64748b;">
-                {position.avg_price}c avg &#x2192; {position.current_price}c now
+                {avg_price}c avg &#x2192; {current_price}c now
             </div>
             <div style="text-align: right;">
                 <span style="font-size: 14px; font-weight: 600; color: {pnl_color};">
-                    {format_currency(position.unrealized_pnl, include_sign=True)}
+                    {pnl}
                 </span>
                 <span style="font-size: 12px; color: {pnl_color}; margin-left: 4px;">
-                    ({'+' if pnl_pct >= 0 else ''}{pnl_pct:.1f}%)
+                    ({pnl_pct_sign}{pnl_pct:.1f}%)
                 </span>
             </div>
         </div>
     </div>
-    """
-
-
-def render_portfolio_html(
-    positions: List[Position],
-    total_value: float,
-    total_pnl: float,
-    balance: float
-) -> str:
-    """Render the full portfolio view as HTML.
-
-    Args:
-        positions: List of current positions
-        total_value: Total portfolio value
-        total_pnl: Total unrealized P&L
-        balance: Available cash balance
-
-    Returns:
-        HTML string for the portfolio view
-    """
-    pnl_color = format_pnl_color(total_pnl)
+    """)
 
-    # Render position rows
-    if positions:
-        positions_html = "".join(render_position_row(p) for p in positions)
-    else:
-        positions_html = """
+_NO_POSITIONS_HTML = minify_html("""
         <div style="
             text-align: center;
             padding: 40px 20px;
@@ -162,9 +102,20 @@ def render_portfolio_html(
                 Your trades will appear here
             </div>
         </div>
-        """
+        """)
 
-    html = f"""
+_POSITIONS_HEADER_HTML = minify_html("""
+        <div style="
+            padding: 8px 0 4px 0;
+            font-size: 12px;
+            color: #64748b;
+            font-weight: 500;
+        ">
+            Open Positions
+        </div>
+        """)
+
+_PORTFOLIO_SHELL = minify_html("""
     <div style="
         background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
         border: 1px solid #334155;
@@ -220,43 +171,32 @@ def render_portfolio_html(
             ">
                 <div style="font-size: 12px; color: #64748b; margin-bottom: 4px;">Unrealized P&amp;L</div>
                 <div style="font-size: 20px; font-weight: 600; color: {pnl_color};">
-                    {format_currency(total_pnl, include_sign=True)}
+                    {total_pnl}
                 </div>
             </div>
         </div>
 
-        <!-- Positions Header -->
-        {'''
-        <div style="
-            padding: 8px 0 4px 0;
-            font-size: 12px;
-            color: #64748b;
-            font-weight: 500;
-        ">
-            Open Positions
-        </div>
-        ''' if positions else ''}
-
         <!-- Positions -->
         {positions_html}
     </div>
-    """
-    return html
-
+    """)
 
-def render_balance_html(balance: float, pending_trades: int = 0) -> str:
-    """Render a compact balance display.
-
-    Args:
-        balance: Available balance in USD
-        pending_trades: Number of pending trade proposals
+_EMPTY_PORTFOLIO_HTML = minify_html("""
+    <div style="
+        background: #1e293b;
+        border: 1px solid #334155;
+        border-radius: 12px;
+        padding: 40px 20px;
+        text-align: center;
+        font-family: system-ui, -apple-system, sans-serif;
+        color: #64748b;
+    ">
+        <div style="font-size: 24px; margin-bottom: 8px;">&#x1F4BC;</div>
+        <div style="font-size: 14px;">Loading portfolio...</div>
+    </div>
+    """)
 
-    Returns:
-        HTML string for balance display
-    """
-    pending_html = ""
-    if pending_trades > 0:
-        pending_html = f"""
+_PENDING_BADGE = minify_html("""
         <span style="
             background: #fbbf24;
             color: #78350f;
@@ -266,9 +206,9 @@ def render_balance_html(balance: float, pending_trades: int = 0) -> str:
             font-weight: 500;
             margin-left: 8px;
         ">{pending_trades} pending</span>
-        """
+        """)
 
-    html = f"""
+_BALANCE_SHELL = minify_html("""
     <div style="
         display: inline-flex;
         align-items: center;
@@ -284,26 +224,139 @@ def render_balance_html(balance: float, pending_trades: int = 0) -> str:
         <span style="font-size: 16px; font-weight: 600; color: #f1f5f9;">${balance:.2f}</span>
         {pending_html}
     </div>
+    """)
+
+
+# P&L colors indexed by sign: 0 -> gray, 1 -> green, -1 -> red
+_PNL_COLORS = ("#94a3b8", "#22c55e", "#ef4444")
+
+# Longer market titles are cut to keep rows on one or two lines
+_TITLE_MAX_CHARS = 50
+
+
+def format_currency(amount: float, include_sign: bool = False) -> str:
+    """Format amount as USD currency."""
+    if include_sign:
+        return f"+${amount:.2f}" if amount >= 0 else f"-${-amount:.2f}"
+    return f"${abs(amount):.2f}"
+
+
+def format_pnl_color(pnl: float) -> str:
+    """Get color for P&L display."""
+    return _PNL_COLORS[(pnl > 0) - (pnl < 0)]
+
+
+def render_position_row(position: Position) -> str:
+    """Render a single position as an HTML row.
+
+    Args:
+        position: The position to render
+
+    Returns:
+        HTML string for the position row
+    """
+    return _render_row(
+        position.title,
+        position.side,
+        position.contracts,
+        position.avg_price,
+        position.current_price,
+        position.current_value,
+        position.unrealized_pnl,
+        position.cost_basis,
+        position.close_time,
+    )
+
+
+@lru_cache(maxsize=512)
+def _render_row(
+    title: str,
+    side: str,
+    contracts: int,
+    avg_price: int,
+    current_price: int,
+    current_value: float,
+    unrealized_pnl: float,
+    cost_basis: float,
+    close_time: Optional[datetime],
+) -> str:
+    """Format one position row from hashable scalars.
+
+    Refreshes mostly return the same positions, so unchanged rows are
+    served from the cache instead of being formatted again.
     """
-    return html
+    # Calculate P&L percentage
+    if cost_basis <= 0:
+        cost_basis = contracts * avg_price * 0.01
+    pnl_pct = unrealized_pnl * 100.0 / cost_basis if cost_basis > 0 else 0.0
+
+    return _ROW_TMPL.format(
+        title=title if len(title) <= _TITLE_MAX_CHARS else title[:_TITLE_MAX_CHARS] + "…",
+        side=side,
+        side_color="#3b82f6" if side == "YES" else "#f97316",
+        contracts=contracts,
+        resolve_date=close_time.strftime("%b %d, %Y") if close_time else "TBD",
+        cost_basis=cost_basis,
+        current_value=current_value,
+        max_payout=contracts,  # $1 per contract if wins
+        avg_price=avg_price,
+        current_price=current_price,
+        pnl_color=_PNL_COLORS[(unrealized_pnl > 0) - (unrealized_pnl < 0)],
+        pnl=f"+${unrealized_pnl:.2f}" if unrealized_pnl >= 0 else f"-${-unrealized_pnl:.2f}",
+        pnl_pct_sign="+" if pnl_pct >= 0 else "",
+        pnl_pct=pnl_pct,
+    )
+
+
+def render_portfolio_html(
+    positions: List[Position],
+    total_value: float,
+    total_pnl: float,
+    balance: float
+) -> str:
+    """Render the full portfolio view as HTML.
+
+    Args:
+        positions: List of current positions
+        total_value: Total portfolio value
+        total_pnl: Total unrealized P&L
+        balance: Available cash balance
+
+    Returns:
+        HTML string for the portfolio view
+    """
+    # Render position rows
+    if positions:
+        positions_html = _POSITIONS_HEADER_HTML + "".join([render_position_row(p) for p in positions])
+    else:
+        positions_html = _NO_POSITIONS_HTML
+
+    return _PORTFOLIO_SHELL.format(
+        balance=balance,
+        total_value=total_value,
+        pnl_color=_PNL_COLORS[(total_pnl > 0) - (total_pnl < 0)],
+        total_pnl=f"+${total_pnl:.2f}" if total_pnl >= 0 else f"-${-total_pnl:.2f}",
+        positions_html=positions_html,
+    )
+
+
+def render_balance_html(balance: float, pending_trades: int = 0) -> str:
+    """Render a compact balance display.
+
+    Args:
+        balance: Available balance in USD
+        pending_trades: Number of pending trade proposals
+
+    Returns:
+        HTML string for balance display
+    """
+    pending_html = _PENDING_BADGE.format(pending_trades=pending_trades) if pending_trades > 0 else ""
+    return _BALANCE_SHELL.format(balance=balance, pending_html=pending_html)
 
 
 def render_empty_portfolio_html() -> str:
     """Render placeholder when portfolio hasn't loaded yet."""
-    return """
-    <div style="
-        background: #1e293b;
-        border: 1px solid #334155;
-        border-radius: 12px;
-        padding: 40px 20px;
-        text-align: center;
-        font-family: system-ui, -apple-system, sans-serif;
-        color: #64748b;
-    ">
-        <div style="font-size: 24px; margin-bottom: 8px;">&#x1F4BC;</div>
-        <div style="font-size: 14px;">Loading portfolio...</div>
-    </div>
-    """
+    return _EMPTY_PORTFOLIO_HTML
 
 
 def create_portfolio_component():
@@ -7,280 +7,207 @@ SECURITY: The ghost token is generated CLIENT-SIDE when the user
 clicks [APPROVE]. This prevents the agent from forging approvals.
 """
 
-import uuid
+import secrets
 import time
-from typing import Optional, Tuple
+from datetime import timezone
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
 from dataclasses import dataclass
 
 import gradio as gr
 
+from frontend.components.minify import minify_html
 from models import TradeProposal, ExecutedTrade
 
 
-@dataclass
-class TradeCardState:
-    """State for tracking active trade proposal."""
-    proposal: Optional[TradeProposal] = None
-    countdown_active: bool = False
-
-
-def generate_ghost_token() -> Tuple[str, int]:
-    """Generate a ghost token for trade approval.
-
-    SECURITY: This function MUST be called client-side (in the frontend)
-    when the user clicks the approve button. The agent cannot call this.
-
-    Returns:
-        Tuple of (token: str, timestamp: int)
-    """
-    token = str(uuid.uuid4())
-    timestamp = int(time.time())
-    return token, timestamp
-
-
-def format_currency(amount: float) -> str:
-    """Format amount as USD currency."""
-    if amount >= 0:
-        return f"${amount:.2f}"
-    return f"-${abs(amount):.2f}"
-
-
-def format_percentage(value: float, include_sign: bool = True) -> str:
-    """Format decimal as percentage."""
-    pct = value * 100
-    if include_sign and value > 0:
-        return f"+{pct:.1f}%"
-    return f"{pct:.1f}%"
-
-
-def calculate_time_remaining(proposal: TradeProposal) -> int:
-    """Calculate seconds remaining until proposal expires."""
-    from datetime import datetime, timezone
-    now = datetime.now(timezone.utc)
-    expires = proposal.expires_at
-    if expires.tzinfo is None:
-        expires = expires.replace(tzinfo=timezone.utc)
-    remaining = (expires - now).total_seconds()
-    return max(0, int(remaining))
-
-
-def render_trade_card_html(proposal: TradeProposal) -> str:
-    """Render trade proposal as HTML card.
-
-    Args:
-        proposal: The trade proposal to render
-
-    Returns:
-        HTML string for the trade card
-    """
-    # Determine edge color
-    edge_color = "#22c55e" if proposal.edge > 0 else "#ef4444"  # green or red
-    edge_label = "Favorable" if proposal.edge > 0 else "Unfavorable"
-    edge_icon = "&#x2705;" if proposal.edge > 0 else "&#x26A0;&#xFE0F;"
-
-    # Side color
-    side_color = "#3b82f6" if proposal.side == "YES" else "#f97316"  # blue or orange
-
-    # Calculate conviction bar width
-    conviction_width = int(proposal.conviction * 100)
-    market_width = int(proposal.market_implied * 100)
-
-    # Calculate profit percentage
-    profit_pct = (proposal.max_profit / proposal.total_cost) * 100 if proposal.total_cost > 0 else 0
+# ============================================================
+# STATIC HTML SHELLS
+# ============================================================
+
+# Static styling for _TRADE_CARD_TMPL. Passed once as the css_template of
+# the gr.HTML that displays trade cards (Gradio scopes it to that
+# component), so each card carries only its data and per-card colors/widths.
+TRADE_CARD_CSS = """
+.tc-root {
+    background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
+    border: 1px solid #334155;
+    border-radius: 12px;
+    padding: 24px;
+    font-family: system-ui, -apple-system, sans-serif;
+    color: #e2e8f0;
+    max-width: 500px;
+    margin: 10px auto;
+}
+.tc-header { display: flex; align-items: center; gap: 10px; margin-bottom: 16px; }
+.tc-header-icon { font-size: 24px; }
+.tc-header-text { font-size: 18px; font-weight: 600; color: #f8fafc; }
+.tc-panel { background: #1e293b; border-radius: 8px; padding: 12px; }
+.tc-section { margin-bottom: 16px; }
+.tc-center { text-align: center; }
+.tc-market-label { font-size: 14px; color: #94a3b8; margin-bottom: 4px; }
+.tc-market-title { font-size: 16px; font-weight: 500; color: #f1f5f9; }
+.tc-market-subtitle { font-size: 18px; font-weight: 600; color: #60a5fa; margin-top: 4px; }
+.tc-market-meta { font-size: 12px; color: #64748b; margin-top: 4px; }
+.tc-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 12px; margin-bottom: 16px; }
+.tc-label { font-size: 12px; color: #94a3b8; }
+.tc-stat { font-size: 20px; font-weight: 600; color: #f1f5f9; }
+.tc-cost { font-size: 28px; font-weight: 700; color: #f1f5f9; }
+.tc-outcome { border-radius: 8px; padding: 12px; text-align: center; }
+.tc-win { background: rgba(34, 197, 94, 0.1); border: 1px solid rgba(34, 197, 94, 0.3); }
+.tc-lose { background: rgba(239, 68, 68, 0.1); border: 1px solid rgba(239, 68, 68, 0.3); }
+.tc-outcome-value { font-size: 18px; font-weight: 600; }
+.tc-outcome-pct { font-size: 12px; }
+.tc-green { color: #22c55e; }
+.tc-red { color: #ef4444; }
+.tc-bar { margin-bottom: 12px; }
+.tc-bar-head { display: flex; justify-content: space-between; margin-bottom: 4px; }
+.tc-bar-value { font-size: 14px; font-weight: 600; color: #f1f5f9; }
+.tc-bar-track { background: #334155; border-radius: 4px; height: 8px; overflow: hidden; }
+.tc-bar-fill { height: 100%; border-radius: 4px; }
+.tc-edge-row {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    padding-top: 8px;
+    border-top: 1px solid #334155;
+}
+.tc-edge-label { font-size: 14px; color: #94a3b8; }
+.tc-edge { font-size: 16px; font-weight: 600; display: flex; align-items: center; gap: 6px; }
+.tc-edge-note { font-size: 12px; }
+.tc-reasoning { font-size: 14px; color: #cbd5e1; line-height: 1.5; }
+.tc-expiry {
+    text-align: center;
+    padding: 8px;
+    background: rgba(251, 191, 36, 0.1);
+    border: 1px solid rgba(251, 191, 36, 0.3);
+    border-radius: 8px;
+    max-width: 500px;
+    margin: 0 auto 8px auto;
+    box-sizing: border-box;
+    font-family: system-ui, -apple-system, sans-serif;
+}
+.tc-expiry-icon { color: #fbbf24; }
+.tc-expiry-text { color: #fbbf24; font-size: 14px; margin-left: 6px; }
+.tc-trade-id { text-align: center; font-size: 10px; color: #475569; }
+"""
 
-    html = f"""
-    <div style="
-        background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
-        border: 1px solid #334155;
-        border-radius: 12px;
-        padding: 24px;
-        font-family: system-ui, -apple-system, sans-serif;
-        color: #e2e8f0;
-        max-width: 500px;
-        margin: 10px auto;
-    ">
+_TRADE_CARD_TMPL = minify_html("""
+    <div class="tc-root">
         <!-- Header -->
-        <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 16px;">
-            <span style="font-size: 24px;">&#x1F4CA;</span>
-            <span style="font-size: 18px; font-weight: 600; color: #f8fafc;">TRADE PROPOSAL</span>
+        <div class="tc-header">
+            <span class="tc-header-icon">&#x1F4CA;</span>
+            <span class="tc-header-text">TRADE PROPOSAL</span>
         </div>
 
         <!-- Market Title -->
-        <div style="
-            background: #1e293b;
-            border-radius: 8px;
-            padding: 12px;
-            margin-bottom: 16px;
-        ">
-            <div style="font-size: 14px; color: #94a3b8; margin-bottom: 4px;">Market</div>
-            <div style="font-size: 16px; font-weight: 500; color: #f1f5f9;">{proposal.title}</div>
-            {f'<div style="font-size: 18px; font-weight: 600; color: #60a5fa; margin-top: 4px;">{proposal.subtitle}</div>' if proposal.subtitle else ''}
-            <div style="font-size: 12px; color: #64748b; margin-top: 4px;">
-                {proposal.ticker}
-                {f' | Resolves: {proposal.close_time.strftime("%b %d, %Y")}' if proposal.close_time else ''}
+        <div class="tc-panel tc-section">
+            <div class="tc-market-label">Market</div>
+            <div class="tc-market-title">{title}</div>
+            {subtitle_html}
+            <div class="tc-market-meta">
+                {ticker}
+                {resolves_html}
             </div>
         </div>
 
         <!-- Position Details -->
-        <div style="
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 12px;
-            margin-bottom: 16px;
-        ">
-            <div style="background: #1e293b; border-radius: 8px; padding: 12px;">
-                <div style="font-size: 12px; color: #94a3b8;">Position</div>
-                <div style="font-size: 20px; font-weight: 600; color: {side_color};">
-                    {proposal.subtitle if proposal.subtitle else proposal.side} @ {proposal.limit_price}c
+        <div class="tc-grid">
+            <div class="tc-panel">
+                <div class="tc-label">Position</div>
+                <div class="tc-stat" style="color: {side_color};">
+                    {position_label} @ {limit_price}c
                 </div>
             </div>
-            <div style="background: #1e293b; border-radius: 8px; padding: 12px;">
-                <div style="font-size: 12px; color: #94a3b8;">Contracts</div>
-                <div style="font-size: 20px; font-weight: 600; color: #f1f5f9;">{proposal.contracts}</div>
+            <div class="tc-panel">
+                <div class="tc-label">Contracts</div>
+                <div class="tc-stat">{contracts}</div>
             </div>
         </div>
 
         <!-- Cost -->
-        <div style="
-            background: #1e293b;
-            border-radius: 8px;
-            padding: 12px;
-            margin-bottom: 16px;
-            text-align: center;
-        ">
-            <div style="font-size: 12px; color: #94a3b8;">Total Cost</div>
-            <div style="font-size: 28px; font-weight: 700; color: #f1f5f9;">
-                {format_currency(proposal.total_cost)}
+        <div class="tc-panel tc-section tc-center">
+            <div class="tc-label">Total Cost</div>
+            <div class="tc-cost">
+                {total_cost}
             </div>
         </div>
 
         <!-- Outcomes -->
-        <div style="
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 12px;
-            margin-bottom: 16px;
-        ">
-            <div style="
-                background: rgba(34, 197, 94, 0.1);
-                border: 1px solid rgba(34, 197, 94, 0.3);
-                border-radius: 8px;
-                padding: 12px;
-                text-align: center;
-            ">
-                <div style="font-size: 12px; color: #94a3b8;">If {proposal.side} wins</div>
-                <div style="font-size: 18px; font-weight: 600; color: #22c55e;">
-                    +{format_currency(proposal.max_profit)}
+        <div class="tc-grid">
+            <div class="tc-outcome tc-win">
+                <div class="tc-label">If {side} wins</div>
+                <div class="tc-outcome-value tc-green">
+                    +{max_profit}
                 </div>
-                <div style="font-size: 12px; color: #22c55e;">
+                <div class="tc-outcome-pct tc-green">
                     (+{profit_pct:.0f}%)
                 </div>
             </div>
-            <div style="
-                background: rgba(239, 68, 68, 0.1);
-                border: 1px solid rgba(239, 68, 68, 0.3);
-                border-radius: 8px;
-                padding: 12px;
-                text-align: center;
-            ">
-                <div style="font-size: 12px; color: #94a3b8;">If {proposal.side} loses</div>
-                <div style="font-size: 18px; font-weight: 600; color: #ef4444;">
-                    -{format_currency(proposal.max_loss)}
+            <div class="tc-outcome tc-lose">
+                <div class="tc-label">If {side} loses</div>
+                <div class="tc-outcome-value tc-red">
+                    -{max_loss}
                 </div>
-                <div style="font-size: 12px; color: #ef4444;">(-100%)</div>
+                <div class="tc-outcome-pct tc-red">(-100%)</div>
             </div>
         </div>
 
         <!-- Conviction vs Market -->
-        <div style="
-            background: #1e293b;
-            border-radius: 8px;
-            padding: 12px;
-            margin-bottom: 16px;
-        ">
-            <div style="margin-bottom: 12px;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
-                    <span style="font-size: 12px; color: #94a3b8;">Your Conviction</span>
-                    <span style="font-size: 14px; font-weight: 600; color: #f1f5f9;">{conviction_width}%</span>
+        <div class="tc-panel tc-section">
+            <div class="tc-bar">
+                <div class="tc-bar-head">
+                    <span class="tc-label">Your Conviction</span>
+                    <span class="tc-bar-value">{conviction_width}%</span>
                 </div>
-                <div style="background: #334155; border-radius: 4px; height: 8px; overflow: hidden;">
-                    <div style="background: #3b82f6; height: 100%; width: {conviction_width}%; border-radius: 4px;"></div>
+                <div class="tc-bar-track">
+                    <div class="tc-bar-fill" style="background: #3b82f6; width: {conviction_width}%;"></div>
                 </div>
             </div>
-            <div style="margin-bottom: 12px;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
-                    <span style="font-size: 12px; color: #94a3b8;">Market Implied</span>
-                    <span style="font-size: 14px; font-weight: 600; color: #f1f5f9;">{market_width}%</span>
+            <div class="tc-bar">
+                <div class="tc-bar-head">
+                    <span class="tc-label">Market Implied</span>
+                    <span class="tc-bar-value">{market_width}%</span>
                 </div>
-                <div style="background: #334155; border-radius: 4px; height: 8px; overflow: hidden;">
-                    <div style="background: #94a3b8; height: 100%; width: {market_width}%; border-radius: 4px;"></div>
+                <div class="tc-bar-track">
+                    <div class="tc-bar-fill" style="background: #94a3b8; width: {market_width}%;"></div>
                 </div>
             </div>
-            <div style="display: flex; justify-content: space-between; align-items: center; padding-top: 8px; border-top: 1px solid #334155;">
-                <span style="font-size: 14px; color: #94a3b8;">Edge</span>
-                <span style="
-                    font-size: 16px;
-                    font-weight: 600;
-                    color: {edge_color};
-                    display: flex;
-                    align-items: center;
-                    gap: 6px;
-                ">
-                    {format_percentage(proposal.edge)}
-                    <span style="font-size: 12px;">{edge_icon} {edge_label}</span>
+            <div class="tc-edge-row">
+                <span class="tc-edge-label">Edge</span>
+                <span class="tc-edge" style="color: {edge_color};">
+                    {edge}
+                    <span class="tc-edge-note">{edge_icon} {edge_label}</span>
                 </span>
             </div>
         </div>
 
         <!-- Reasoning -->
-        <div style="
-            background: #1e293b;
-            border-radius: 8px;
-            padding: 12px;
-            margin-bottom: 16px;
-        ">
-            <div style="font-size: 12px; color: #94a3b8; margin-bottom: 4px;">Reasoning</div>
-            <div style="font-size: 14px; color: #cbd5e1; line-height: 1.5;">{proposal.reasoning}</div>
-        </div>
-
-        <!-- Expiry Warning -->
-        <div style="
-            text-align: center;
-            padding: 8px;
-            background: rgba(251, 191, 36, 0.1);
-            border: 1px solid rgba(251, 191, 36, 0.3);
-            border-radius: 8px;
-            margin-bottom: 8px;
-        ">
-            <span style="color: #fbbf24;">&#x23F1;&#xFE0F;</span>
-            <span style="color: #fbbf24; font-size: 14px; margin-left: 6px;">
-                Expires in {calculate_time_remaining(proposal)} seconds
-            </span>
+        <div class="tc-panel tc-section">
+            <div class="tc-label" style="margin-bottom: 4px;">Reasoning</div>
+            <div class="tc-reasoning">{reasoning}</div>
         </div>
 
         <!-- Trade ID (for debugging) -->
-        <div style="text-align: center; font-size: 10px; color: #475569;">
-            Trade ID: {proposal.trade_id}
+        <div class="tc-trade-id">
+            Trade ID: {trade_id}
         </div>
     </div>
-    """
-    return html
-
-
-def render_executed_trade_html(trade: ExecutedTrade) -> str:
-    """Render executed trade confirmation as HTML.
+    """)
+
+# Rendered into its own component so the per-second countdown doesn't
+# resend the whole card
+_COUNTDOWN_TMPL = minify_html("""
+    <div class="tc-expiry">
+        <span class="tc-expiry-icon">&#x23F1;&#xFE0F;</span>
+        <span class="tc-expiry-text">
+            Expires in {time_remaining} seconds
+        </span>
+    </div>
+    """)
 
-    Args:
-        trade: The executed trade to render
+_SUBTITLE_TMPL = '<div class="tc-market-subtitle">{subtitle}</div>'
 
-    Returns:
-        HTML string for the confirmation
-    """
-    # Calculate potential outcomes
-    win_value = trade.contracts * 1.00  # $1 per contract if side wins
-    profit = win_value - trade.total_cost
-
-    html = f"""
+_EXECUTED_TRADE_TMPL = minify_html("""
     <div style="
         background: linear-gradient(135deg, #064e3b 0%, #022c22 100%);
         border: 1px solid #10b981;
@@ -302,26 +229,26 @@ def render_executed_trade_html(trade: ExecutedTrade) -> str:
             <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 12px;">
                 <div>
                     <div style="font-size: 12px; color: #94a3b8;">Side</div>
-                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">{trade.side}</div>
+                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">{side}</div>
                 </div>
                 <div>
                     <div style="font-size: 12px; color: #94a3b8;">Fill Price</div>
-                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">{trade.fill_price}c</div>
+                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">{fill_price}c</div>
                 </div>
                 <div>
                     <div style="font-size: 12px; color: #94a3b8;">Contracts</div>
-                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">{trade.contracts}</div>
+                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">{contracts}</div>
                 </div>
                 <div>
                     <div style="font-size: 12px; color: #94a3b8;">Total Cost</div>
-                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">${trade.total_cost:.2f}</div>
+                    <div style="font-size: 18px; font-weight: 600; color: #f1f5f9;">${total_cost:.2f}</div>
                 </div>
             </div>
         </div>
 
         <!-- Outcome Preview -->
         <div style="background: rgba(0,0,0,0.2); border-radius: 8px; padding: 16px; margin-bottom: 16px;">
-            <div style="font-size: 14px; color: #94a3b8; margin-bottom: 8px;">If {trade.side} wins:</div>
+            <div style="font-size: 14px; color: #94a3b8; margin-bottom: 8px;">If {side} wins:</div>
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <span style="color: #cbd5e1;">You receive</span>
                 <span style="font-size: 20px; font-weight: 600; color: #10b981;">${win_value:.2f}</span>
@@ -334,23 +261,12 @@ def render_executed_trade_html(trade: ExecutedTrade) -> str:
 
         <!-- Order ID -->
         <div style="text-align: center; font-size: 12px; color: #64748b;">
-            Order ID: {trade.order_id}
+            Order ID: {order_id}
         </div>
     </div>
-    """
-    return html
-
+    """)
 
-def render_error_card_html(error_message: str) -> str:
-    """Render an error message as an HTML card.
-
-    Args:
-        error_message: The error message to display
-
-    Returns:
-        HTML string for the error card
-    """
-    html = f"""
+_ERROR_CARD_TMPL = minify_html("""
     <div style="
         background: linear-gradient(135deg, #7f1d1d 0%, #450a0a 100%);
         border: 1px solid #ef4444;
@@ -366,17 +282,9 @@ def render_error_card_html(error_message: str) -> str:
         <div style="font-size: 18px; font-weight: 600; color: #fca5a5; margin-bottom: 8px;">Trade Failed</div>
         <div style="font-size: 14px; color: #fecaca;">{error_message}</div>
     </div>
-    """
-    return html
-
-
-def render_expired_card_html() -> str:
-    """Render an expired proposal message.
+    """)
 
-    Returns:
-        HTML string for expired message
-    """
-    html = """
+_EXPIRED_CARD_HTML = minify_html("""
     <div style="
         background: linear-gradient(135deg, #78350f 0%, #451a03 100%);
         border: 1px solid #f59e0b;
@@ -392,19 +300,242 @@ def render_expired_card_html() -> str:
         <div style="font-size: 18px; font-weight: 600; color: #fcd34d; margin-bottom: 8px;">Proposal Expired</div>
         <div style="font-size: 14px; color: #fde68a;">The approval window has closed. Please request a new trade proposal.</div>
     </div>
+    """)
+
+
+@dataclass
+class TradeCardState:
+    """State for tracking active trade proposal."""
+    proposal: Optional[TradeProposal] = None
+    countdown_active: bool = False
+
+
+def generate_ghost_token() -> Tuple[str, int]:
+    """Generate a ghost token for trade approval.
+
+    SECURITY: This function MUST be called client-side (in the frontend)
+    when the user clicks the approve button. The agent cannot call this.
+
+    Returns:
+        Tuple of (token: str, timestamp: int)
     """
+    # 128 random bits laid out as a UUID string (8-4-4-4-12); the server
+    # validates the token as a 36-char UUID
+    h = secrets.token_hex(16)
+    token = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    timestamp = time.time_ns() // 1_000_000_000
+    return token, timestamp
+
+
+# Edge styling indexed by int(edge > 0): unfavorable, favorable
+_EDGE_COLOR = ("#ef4444", "#22c55e")
+_EDGE_LABEL = ("Unfavorable", "Favorable")
+_EDGE_ICON = ("&#x26A0;&#xFE0F;", "&#x2705;")
+
+# Position color by side: blue for YES, orange for NO
+_SIDE_COLOR = {"YES": "#3b82f6", "NO": "#f97316"}
+
+
+# Rendered cards by trade_id. A card never changes once proposed (the
+# countdown is rendered separately), so entries are only dropped when the
+# proposal is resolved or, oldest first, when the cache is full.
+_RENDER_CACHE: Dict[str, str] = {}
+_RENDER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=1024)
+def format_currency(amount: float) -> str:
+    """Format amount as USD currency."""
+    if amount >= 0:
+        return f"${amount:.2f}"
+    return f"-${abs(amount):.2f}"
+
+
+@lru_cache(maxsize=1024)
+def format_percentage(value: float, include_sign: bool = True) -> str:
+    """Format decimal as percentage."""
+    pct = value * 100
+    if include_sign and value > 0:
+        return f"+{pct:.1f}%"
+    return f"{pct:.1f}%"
+
+
+def calculate_time_remaining(proposal: TradeProposal) -> int:
+    """Calculate seconds remaining until proposal expires."""
+    expires = proposal.expires_at
+    if expires.tzinfo is None:
+        # Naive timestamps are UTC throughout the app
+        expires = expires.replace(tzinfo=timezone.utc)
+    return max(0, int(expires.timestamp() - time.time()))
+
+
+def render_trade_card_html(proposal: TradeProposal) -> str:
+    """Render trade proposal as HTML card.
+
+    Args:
+        proposal: The trade proposal to render
+
+    Returns:
+        HTML string for the trade card
+    """
+    cached = _RENDER_CACHE.get(proposal.trade_id)
+    if cached is not None:
+        return cached
+
+    # Determine edge styling
+    favorable = proposal.edge > 0
+    edge_color = _EDGE_COLOR[favorable]
+    edge_label = _EDGE_LABEL[favorable]
+    edge_icon = _EDGE_ICON[favorable]
+
+    # Side color
+    side_color = _SIDE_COLOR.get(proposal.side, _SIDE_COLOR["NO"])
+
+    # Calculate conviction bar width
+    conviction_width = int(proposal.conviction * 100)
+    market_width = int(proposal.market_implied * 100)
+
+    # Calculate profit percentage
+    profit_pct = (proposal.max_profit / proposal.total_cost) * 100 if proposal.total_cost > 0 else 0
+
+    html = _TRADE_CARD_TMPL.format_map({
+        "title": proposal.title,
+        "subtitle_html": _SUBTITLE_TMPL.format(subtitle=proposal.subtitle) if proposal.subtitle else "",
+        "ticker": proposal.ticker,
+        "resolves_html": f" | Resolves: {proposal.close_time_str}" if proposal.close_time_str else "",
+        "side_color": side_color,
+        "position_label": proposal.subtitle if proposal.subtitle else proposal.side,
+        "limit_price": proposal.limit_price,
+        "contracts": proposal.contracts,
+        "total_cost": format_currency(proposal.total_cost),
+        "side": proposal.side,
+        "max_profit": format_currency(proposal.max_profit),
+        "profit_pct": profit_pct,
+        "max_loss": format_currency(proposal.max_loss),
+        "conviction_width": conviction_width,
+        "market_width": market_width,
+        "edge_color": edge_color,
+        "edge": format_percentage(proposal.edge),
+        "edge_icon": edge_icon,
+        "edge_label": edge_label,
+        "reasoning": proposal.reasoning,
+        "trade_id": proposal.trade_id,
+    })
+
+    _RENDER_CACHE[proposal.trade_id] = html
+    if len(_RENDER_CACHE) > _RENDER_CACHE_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest
+        del _RENDER_CACHE[next(iter(_RENDER_CACHE))]
     return html
 
 
+def forget_trade_card(trade_id: Optional[str]) -> None:
+    """Drop a resolved proposal's card from the render cache.
+
+    Args:
+        trade_id: The proposal trade ID (ignored if None or not cached)
+    """
+    _RENDER_CACHE.pop(trade_id, None)
+
+
+def render_countdown_html(proposal: TradeProposal) -> str:
+    """Render the approval countdown shown under a trade card.
+
+    Args:
+        proposal: The pending trade proposal
+
+    Returns:
+        HTML string for the countdown banner
+    """
+    return _COUNTDOWN_TMPL.format(time_remaining=calculate_time_remaining(proposal))
+
+
+def render_executed_trade_html(trade: ExecutedTrade) -> str:
+    """Render executed trade confirmation as HTML.
+
+    Args:
+        trade: The executed trade to render
+
+    Returns:
+        HTML string for the confirmation
+    """
+    # Calculate potential outcomes
+    win_value = trade.contracts * 1.00  # $1 per contract if side wins
+    profit = win_value - trade.total_cost
+
+    return _EXECUTED_TRADE_TMPL.format_map({
+        "side": trade.side,
+        "fill_price": trade.fill_price,
+        "contracts": trade.contracts,
+        "total_cost": trade.total_cost,
+        "win_value": win_value,
+        "profit": profit,
+        "order_id": trade.order_id,
+    })
+
+
+def render_trade_cards_html(proposals: Iterable[TradeProposal]) -> str:
+    """Render several trade proposals as one HTML string.
+
+    Prefer this over concatenating render_trade_card_html results: the
+    single join sizes and copies the output once.
+
+    Args:
+        proposals: The trade proposals to render, in display order
+
+    Returns:
+        HTML string with one card per proposal
+    """
+    return "".join(render_trade_card_html(p) for p in proposals)
+
+
+def render_executed_trades_html(trades: Iterable[ExecutedTrade]) -> str:
+    """Render several executed trade confirmations as one HTML string.
+
+    Prefer this over concatenating render_executed_trade_html results:
+    the single join sizes and copies the output once.
+
+    Args:
+        trades: The executed trades to render, in display order
+
+    Returns:
+        HTML string with one confirmation per trade
+    """
+    return "".join(render_executed_trade_html(t) for t in trades)
+
+
+def render_error_card_html(error_message: str) -> str:
+    """Render an error message as an HTML card.
+
+    Args:
+        error_message: The error message to display
+
+    Returns:
+        HTML string for the error card
+    """
+    return _ERROR_CARD_TMPL.format_map({"error_message": error_message})
+
+
+def render_expired_card_html() -> str:
+    """Render an expired proposal message.
+
+    Returns:
+        HTML string for expired message
+    """
+    return _EXPIRED_CARD_HTML
+
+
 def create_trade_card_component():
     """Create the trade card Gradio component group.
 
     Returns:
-        Tuple of (container, html_display, approve_btn, reject_btn, trade_id_state)
+        Tuple of (container, html_display, countdown_display, approve_btn,
+        reject_btn, trade_id_state)
     """
     with gr.Group(visible=False) as container:
         # Gradio 6: padding default changed to False; we use inline CSS for padding
-        html_display = gr.HTML(label="Trade Proposal", padding=False)
+        html_display = gr.HTML(label="Trade Proposal", padding=False, css_template=TRADE_CARD_CSS)
+        countdown_display = gr.HTML(padding=False, css_template=TRADE_CARD_CSS)
 
         with gr.Row():
             approve_btn = gr.Button(
@@ -423,4 +554,4 @@ def create_trade_card_component():
         # Hidden state for trade_id
         trade_id_state = gr.State(value=None)
 
-    return container, html_display, approve_btn, reject_btn, trade_id_state
+    return container, html_display, countdown_display, approve_btn, reject_btn, trade_id_state
@@ -8,6 +8,7 @@ Usage:
     python main.py --server-only   # Start only the API server
     python main.py --frontend-only # Start only the Gradio frontend
     python main.py --skip-index    # Skip market indexing on startup
+    python main.py --fork          # Run the server in a separate process
 
 Requirements:
     - Conda environment: kalshi (activate with `conda activate kalshi`)
@@ -19,16 +20,15 @@ import os
 # Suppress tokenizers parallelism warning when forking
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
-import argparse
 import asyncio
 import logging
+import signal
+import socket
 import sys
 import threading
 import time
 from typing import Optional
 
-import uvicorn
-
 from config import settings
 
 
@@ -41,9 +41,13 @@ logging.basicConfig(
 logger = logging.getLogger("kalshi-agent")
 
 
-def check_environment():
+def check_environment(frontend_only: bool = False):
     """Verify environment is properly configured.
 
+    Args:
+        frontend_only: Skip the private key check; the frontend talks to
+            the API server and never signs Kalshi requests itself
+
     Raises:
         SystemExit: If required configuration is missing
     """
@@ -57,12 +61,13 @@ def check_environment():
         errors.append("No LLM API key set. Add ANTHROPIC_API_KEY or GROQ_API_KEY (free) to .env")
 
     # Check private key file
-    try:
-        settings.get_private_key()
-    except FileNotFoundError as e:
-        errors.append(str(e))
-    except ValueError as e:
-        errors.append(str(e))
+    if not frontend_only:
+        try:
+            settings.load_private_key()
+        except FileNotFoundError as e:
+            errors.append(str(e))
+        except ValueError as e:
+            errors.append(str(e))
 
     if errors:
         logger.error("Configuration errors found:")
@@ -81,31 +86,124 @@ def check_environment():
     logger.info(f"  Ghost token TTL: {settings.ghost_token_ttl}s")
 
 
-def run_api_server(host: str, port: int):
-    """Run the FastAPI server.
+def build_server_config(host: str, port: int) -> "uvicorn.Config":
+    """Build the uvicorn config shared by every way of running the API.
+
+    loop/http "auto" pick uvloop and httptools when installed (they ship
+    with uvicorn[standard]) and fall back to asyncio/h11 otherwise.
 
     Args:
         host: Host to bind to
         port: Port to bind to
+
+    Returns:
+        uvicorn Config for agent.server:app
     """
-    logger.info(f"Starting API server on http://{host}:{port}")
+    import uvicorn
 
-    uvicorn.run(
+    return uvicorn.Config(
         "agent.server:app",
         host=host,
         port=port,
+        loop="auto",
+        http="auto",
         reload=False,
         log_level="info",
         access_log=False  # Reduce log noise
     )
 
 
-def run_frontend(host: str, port: int):
+def run_api_server(host: str, port: int):
+    """Run the FastAPI server.
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+
+    Raises:
+        SystemExit: If the server fails to start
+    """
+    logger.info(f"Starting API server on http://{host}:{port}")
+
+    import uvicorn
+
+    server = uvicorn.Server(build_server_config(host, port))
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
+    if not server.started:
+        sys.exit(1)
+
+
+def exec_api_server(host: str, port: int):
+    """Replace this process with a uvicorn process serving the API.
+
+    Used for --server-only: once configuration is checked, the launcher's
+    own state (argparse, logging setup, imported modules) is never needed
+    again, so exec'ing uvicorn drops it instead of keeping it resident.
+    Falls back to run_api_server where exec doesn't replace the process.
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+    """
+    if os.name != "posix":
+        run_api_server(host, port)
+        return
+
+    logger.info(f"Starting API server on http://{host}:{port}")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # Same settings as build_server_config, as CLI flags
+    os.execv(sys.executable, [
+        sys.executable, "-m", "uvicorn", "agent.server:app",
+        "--app-dir", os.path.dirname(os.path.abspath(__file__)),
+        "--host", host,
+        "--port", str(port),
+        "--loop", "auto",
+        "--http", "auto",
+        "--log-level", "info",
+        "--no-access-log",  # Reduce log noise
+    ])
+
+
+def preload_frontend():
+    """Import the Gradio app module in a background thread.
+
+    Gradio and its dependencies take a while to import; starting that
+    while the environment is checked and the API server initializes
+    means run_frontend's import is usually already done. Import errors
+    are left for run_frontend to raise.
+
+    Only done in API mode: in standalone mode (GRADIO_STANDALONE or
+    SPACE_ID, see frontend.app.STANDALONE_MODE) importing the app
+    initializes its own Kalshi client and market index, which must not
+    race the environment check and API server startup.
+    """
+    if os.environ.get("GRADIO_STANDALONE", "").lower() == "true" or os.environ.get("SPACE_ID") is not None:
+        return
+
+    def _import():
+        try:
+            import frontend.app  # noqa: F401
+        except Exception as e:
+            logger.debug(f"Frontend preload failed: {type(e).__name__}: {e}")
+
+    threading.Thread(target=_import, name="frontend-preload", daemon=True).start()
+
+
+def run_frontend(host: str, port: int, block: bool = True):
     """Run the Gradio frontend.
 
     Args:
         host: Host to bind to
         port: Port to bind to
+        block: Block the calling thread until the frontend exits. Pass
+            False to launch it in the background and get the Blocks back.
+
+    Returns:
+        The launched Gradio Blocks app
     """
     logger.info(f"Starting Gradio frontend on http://{host}:{port}")
 
@@ -117,57 +215,275 @@ def run_frontend(host: str, port: int):
         server_port=port,
         share=False,
         show_error=True,
-        quiet=True  # Reduce log noise
+        quiet=True,  # Reduce log noise
+        prevent_thread_lock=not block
     )
+    return app
+
+
+def log_endpoints(host: str, port: int, frontend_port: int):
+    """Log the ready banner with the API, frontend and health URLs."""
+    logger.info("API server is ready!")
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info(f"  API Server:  http://{host}:{port}")
+    logger.info(f"  Frontend:    http://{host}:{frontend_port}")
+    logger.info(f"  Health:      http://{host}:{port}/health")
+    logger.info("=" * 60)
+    logger.info("")
 
 
-def wait_for_server(host: str, port: int, timeout: int = 30) -> bool:
+async def run_combined(config: "uvicorn.Config", frontend_port: int):
+    """Run the API server and the Gradio frontend in one event loop.
+
+    uvicorn serves the API on the running loop while a small task awaits
+    its startup (lifespan done, socket bound) and then launches the
+    frontend on a worker thread, so nothing polls /health or the started
+    flag and the API is never stalled by Gradio's startup.
+
+    Args:
+        config: uvicorn config for the API server
+        frontend_port: Gradio frontend port
+    """
+    import uvicorn
+
+    host, port = config.host, config.port
+    logger.info(f"Starting API server on http://{host}:{port}")
+
+    started = asyncio.Event()
+
+    class SignallingServer(uvicorn.Server):
+        """uvicorn server that sets `started` once startup completes."""
+
+        async def startup(self, sockets=None):
+            await super().startup(sockets=sockets)
+            if self.started:
+                started.set()
+
+    server = SignallingServer(config)
+    frontend = None
+    exit_code = 0
+
+    async def launch_frontend_when_ready():
+        nonlocal frontend, exit_code
+        # Indexing 30k+ markets can take 2-3 minutes on first run
+        logger.info("Waiting for API server to initialize (this may take a few minutes on first run)...")
+        try:
+            await asyncio.wait_for(started.wait(), timeout=300)
+        except asyncio.TimeoutError:
+            logger.error("API server failed to start within 5 minutes")
+            logger.error("Try running with --server-only first, then --frontend-only")
+            # Let serve() wind down and exit from run_combined, not this task
+            exit_code = 1
+            server.should_exit = True
+            return
+
+        from agent.server import ready_event
+        if not ready_event.is_set():
+            logger.warning("API server started but services failed to initialize - see errors above")
+
+        log_endpoints(host, port, frontend_port)
+
+        # Build and launch Gradio off the loop so the API keeps serving
+        frontend = await asyncio.to_thread(run_frontend, host, frontend_port, False)
+
+    launcher = asyncio.create_task(launch_frontend_when_ready())
+    try:
+        # Returns on SIGINT/SIGTERM, which uvicorn handles
+        await server.serve()
+    finally:
+        launcher.cancel()
+        if frontend is not None:
+            frontend.close()
+
+    if exit_code:
+        sys.exit(exit_code)
+    if not server.started:
+        logger.error("API server failed to start")
+        logger.error("Try running with --server-only first, then --frontend-only")
+        sys.exit(1)
+
+
+def run_forked(host: str, port: int, frontend_port: int):
+    """Run the API server in a forked child and the frontend in this process.
+
+    The child inherits the already-checked configuration and imported
+    modules copy-on-write, and the two halves no longer share a GIL. If
+    the child dies, SIGCHLD ends the frontend too; when the frontend
+    exits, the child is terminated.
+
+    Args:
+        host: Host to bind to
+        port: API server port
+        frontend_port: Gradio frontend port
+    """
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            run_api_server(host, port)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except BaseException:
+            logger.exception("API server crashed")
+            code = 1
+        finally:
+            logging.shutdown()
+            os._exit(code)
+
+    # Import after the fork so the child never inherits a half-held import lock
+    preload_frontend()
+
+    def on_child_exit(signum, frame):
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            logger.error("API server process exited - shutting down frontend")
+            sys.exit(1)
+
+    signal.signal(signal.SIGCHLD, on_child_exit)
+    try:
+        # Indexing 30k+ markets can take 2-3 minutes on first run
+        logger.info("Waiting for API server to initialize (this may take a few minutes on first run)...")
+        if not wait_for_server(host, port, timeout=300):
+            logger.error("API server failed to start within 5 minutes")
+            logger.error("Try running with --server-only first, then --frontend-only")
+            sys.exit(1)
+
+        log_endpoints(host, port, frontend_port)
+        run_frontend(host, frontend_port)
+    finally:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        try:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+        except (ProcessLookupError, ChildProcessError):
+            pass  # Already gone and reaped
+
+
+def _run_event_loop(main_coro, config: "uvicorn.Config"):
+    """Run a coroutine on the event loop uvicorn would pick (uvloop if installed).
+
+    Args:
+        main_coro: Coroutine to run to completion
+        config: uvicorn config whose loop setting to honour
+    """
+    get_loop_factory = getattr(config, "get_loop_factory", None)
+    if get_loop_factory is None:
+        # Older uvicorn installs an event loop policy instead
+        config.setup_event_loop()
+        return asyncio.run(main_coro)
+
+    loop_factory = get_loop_factory()
+    if loop_factory is None:
+        return asyncio.run(main_coro)
+    loop = loop_factory()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main_coro)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to sleep after the given (1-based) failed attempt.
+
+    Starts at 50ms so a server that is almost up is caught within a few
+    tight retries, then grows 1.5x per attempt up to a 2s cap.
+    """
+    return min(2.0, 0.05 * 1.5 ** (attempt - 1))
+
+
+def _log_health(client) -> None:
+    """Log the server's /health summary once, after it reports ready.
+
+    Args:
+        client: httpx.Client bound to the API server
+    """
+    import orjson
+
+    try:
+        data = orjson.loads(client.get("/health").content)
+        logger.info(f"Server ready: {data.get('status')} (kalshi={data.get('kalshi_connected')}, index={data.get('index_ready')}, markets={data.get('markets_indexed')})")
+    except Exception as e:
+        logger.info(f"Server ready (health summary unavailable: {type(e).__name__})")
+
+
+def wait_for_server(host: str, port: int, timeout: int = 30, check_health: bool = True) -> bool:
     """Wait for the API server to be ready.
 
+    Probes the port with a bare TCP connect and only starts polling
+    HEAD /ready, over one keep-alive connection, once something is
+    listening. /health is fetched once, after the server reports ready,
+    for the status log line. Retries back off from 50ms to 2s (see
+    _backoff_delay).
+
     Args:
         host: Server host
         port: Server port
         timeout: Maximum seconds to wait
+        check_health: Also require /ready to report the services
+            initialized. When False, a successful TCP connect is enough
+            (and httpx is never imported).
 
     Returns:
         True if server is ready, False if timeout
     """
-    import httpx
-
     # Use 127.0.0.1 to avoid DNS resolution issues with localhost
     connect_host = "127.0.0.1" if host == "0.0.0.0" else host
-    url = f"http://{connect_host}:{port}/health"
-    start = time.time()
+    url = f"http://{connect_host}:{port}/ready"
+    start = time.monotonic()
+    next_wait_log = start
     last_status = None
     check_count = 0
+    client = None  # Keep-alive client, opened once the port is listening
 
-    logger.info(f"Polling {url} for health status...")
+    if check_health:
+        logger.info(f"Polling {url} for readiness...")
+    else:
+        logger.info(f"Probing {connect_host}:{port}...")
 
-    while time.time() - start < timeout:
-        check_count += 1
-        try:
-            response = httpx.get(url, timeout=5.0)
-            if response.status_code == 200:
-                data = response.json()
-                status = data.get("status")
-                if status != last_status:
-                    logger.info(f"Health check #{check_count}: {status} (kalshi={data.get('kalshi_connected')}, index={data.get('index_ready')}, markets={data.get('markets_indexed')})")
-                    last_status = status
-                if status in ["healthy", "degraded"]:
+    try:
+        while time.monotonic() - start < timeout:
+            check_count += 1
+            if client is None:
+                try:
+                    socket.create_connection((connect_host, port), timeout=0.2).close()
+                except OSError:
+                    # Server not yet listening - this is expected during startup
+                    if time.monotonic() >= next_wait_log:  # Log every 10 seconds
+                        logger.info(f"Health check #{check_count}: waiting for server to start...")
+                        next_wait_log += 10
+                    time.sleep(_backoff_delay(check_count))
+                    continue
+
+                if not check_health:
+                    logger.info(f"API server is listening on {connect_host}:{port}")
+                    return True
+
+                import httpx
+
+                client = httpx.Client(
+                    base_url=f"http://{connect_host}:{port}",
+                    timeout=5.0,
+                    limits=httpx.Limits(max_keepalive_connections=1, keepalive_expiry=60),
+                )
+
+            try:
+                response = client.head("/ready")
+                if response.status_code == 204:
+                    _log_health(client)
                     return True
-            else:
                 if last_status != f"HTTP_{response.status_code}":
-                    logger.warning(f"Health check #{check_count}: HTTP {response.status_code}")
+                    logger.info(f"Health check #{check_count}: not ready (HTTP {response.status_code})")
                     last_status = f"HTTP_{response.status_code}"
-        except httpx.ConnectError:
-            # Server not yet listening - this is expected during startup
-            if check_count % 20 == 1:  # Log every 10 seconds
-                logger.info(f"Health check #{check_count}: waiting for server to start...")
-        except Exception as e:
-            if last_status != "error":
-                logger.warning(f"Health check #{check_count} failed: {type(e).__name__}: {e}")
-                last_status = "error"
-        time.sleep(0.5)
+            except Exception as e:
+                if last_status != "error":
+                    logger.warning(f"Health check #{check_count} failed: {type(e).__name__}: {e}")
+                    last_status = "error"
+            time.sleep(_backoff_delay(check_count))
+    finally:
+        if client is not None:
+            client.close()
 
     logger.error(f"Health check timed out after {check_count} attempts")
     return False
@@ -178,7 +494,9 @@ def main(
     frontend_only: bool = False,
     skip_index: bool = False,
     host: Optional[str] = None,
-    port: Optional[int] = None
+    port: Optional[int] = None,
+    debug: bool = False,
+    fork: bool = False
 ):
     """Main entry point.
 
@@ -188,13 +506,19 @@ def main(
         skip_index: Skip market indexing on startup
         host: Override host from settings
         port: Override port from settings
+        debug: Debug mode; keeps --server-only in this process
+        fork: Run the API server in a forked child process instead of
+            on the frontend's event loop (POSIX only)
     """
     host = host or settings.host
     port = port or settings.port
     frontend_port = port + 1
 
+    if not server_only and not fork:
+        preload_frontend()
+
     # Check environment
-    check_environment()
+    check_environment(frontend_only=frontend_only)
 
     logger.info("=" * 60)
     logger.info("  KALSHI ALPHA AGENT")
@@ -210,7 +534,10 @@ def main(
     if server_only:
         # Just run the server
         logger.info("Running in server-only mode")
-        run_api_server(host, port)
+        if debug:
+            run_api_server(host, port)
+        else:
+            exec_api_server(host, port)
 
     elif frontend_only:
         # Just run the frontend (assumes server is already running)
@@ -218,48 +545,37 @@ def main(
         connect_host = "localhost" if host == "0.0.0.0" else host
         logger.info(f"Connecting to API at http://{connect_host}:{port}")
 
-        if not wait_for_server(host, port, timeout=5):
+        if not wait_for_server(host, port, timeout=5, check_health=False):
             logger.warning("API server not responding - frontend may not work correctly")
 
         run_frontend(host, frontend_port)
 
+    elif fork:
+        # Run the server in a child process and the frontend here
+        logger.info("Starting API server (forked) and frontend...")
+        try:
+            run_forked(host, port, frontend_port)
+        except KeyboardInterrupt:
+            logger.info("Shutting down...")
+
     else:
-        # Run both server and frontend
+        # Run both server and frontend on one event loop
         logger.info("Starting both API server and frontend...")
-
-        # Start server in background thread
-        server_thread = threading.Thread(
-            target=run_api_server,
-            args=(host, port),
-            daemon=True
-        )
-        server_thread.start()
-
-        # Wait for server to be ready (indexing 30k+ markets can take 2-3 minutes)
-        logger.info("Waiting for API server to initialize (this may take a few minutes on first run)...")
-        if not wait_for_server(host, port, timeout=300):
-            logger.error("API server failed to start within 5 minutes")
-            logger.error("Try running with --server-only first, then --frontend-only")
-            sys.exit(1)
-
-        logger.info("API server is ready!")
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info(f"  API Server:  http://{host}:{port}")
-        logger.info(f"  Frontend:    http://{host}:{frontend_port}")
-        logger.info(f"  Health:      http://{host}:{port}/health")
-        logger.info("=" * 60)
-        logger.info("")
-
-        # Run frontend in main thread (blocking)
+        config = build_server_config(host, port)
         try:
-            run_frontend(host, frontend_port)
+            _run_event_loop(run_combined(config, frontend_port), config)
         except KeyboardInterrupt:
             logger.info("Shutting down...")
 
 
 def cli():
     """Command-line interface."""
+    # No flags: nothing to parse, so skip building the parser
+    if len(sys.argv) == 1:
+        return main()
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Kalshi Alpha Agent - Convert convictions into trades",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -270,6 +586,7 @@ Examples:
     python main.py --frontend-only     # Frontend only (server must be running)
     python main.py --skip-index        # Skip market indexing
     python main.py --port 9000         # Use custom port
+    python main.py --fork              # Server in a forked process
 
 Environment:
     Activate conda environment first: conda activate kalshi
@@ -304,6 +621,11 @@ Environment:
         default=None,
         help=f"Base port for API server (default: {settings.port}, frontend uses port+1)"
     )
+    parser.add_argument(
+        "--fork",
+        action="store_true",
+        help="Run the API server in a forked child process (POSIX only)"
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -318,12 +640,17 @@ Environment:
     if args.server_only and args.frontend_only:
         parser.error("Cannot use both --server-only and --frontend-only")
 
+    if args.fork and not hasattr(os, "fork"):
+        parser.error("--fork is not supported on this platform")
+
     main(
         server_only=args.server_only,
         frontend_only=args.frontend_only,
         skip_index=args.skip_index,
         host=args.host,
-        port=args.port
+        port=args.port,
+        debug=args.debug,
+        fork=args.fork
     )
 
 
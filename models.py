@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
 from typing import Optional, Literal
 from enum import Enum
@@ -10,6 +10,11 @@ class Side(str, Enum):
     NO = "no"
 
 
+# Side as carried by models and API payloads (upper case). Side above is
+# the lower-case form the Kalshi order API expects.
+TradeSide = Literal["YES", "NO"]
+
+
 class ConvictionExtraction(BaseModel):
     """Extracted trading intent from natural language input.
 
@@ -18,13 +23,13 @@ class ConvictionExtraction(BaseModel):
     """
     has_trading_intent: bool
     topic: Optional[str] = None
-    side: Optional[Literal["YES", "NO"]] = None
+    side: Optional[TradeSide] = None
     conviction: float = Field(ge=0.0, le=1.0, description="Confidence level 0-1")
     timeframe: Optional[str] = None
     keywords: list[str] = Field(default_factory=list)
     reasoning: str
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(json_schema_extra={
         "example": {
             "has_trading_intent": True,
             "topic": "Trump winning 2024 election",
@@ -34,7 +39,7 @@ class ConvictionExtraction(BaseModel):
             "keywords": ["Trump", "win", "election", "2024"],
             "reasoning": "User expressed high confidence with 'very confident'"
         }
-    }}
+    })
 
 
 class MarketMatch(BaseModel):
@@ -56,7 +61,7 @@ class MarketMatch(BaseModel):
         description="Semantic search relevance (0-1)"
     )
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(frozen=True, json_schema_extra={
         "example": {
             "ticker": "PRES-2024-DJT",
             "title": "Will Donald Trump win the 2024 presidential election?",
@@ -68,7 +73,23 @@ class MarketMatch(BaseModel):
             "close_time": "2024-11-05T23:59:59Z",
             "relevance_score": 0.94
         }
-    }}
+    })
+
+    @classmethod
+    def fast_build(cls, **fields) -> "MarketMatch":
+        """Build a MarketMatch without running validation.
+
+        For hot paths whose fields are already sanitized, e.g. search
+        results rebuilt from index metadata (prices clamped at index
+        time). Callers are responsible for types and ranges.
+
+        Args:
+            **fields: MarketMatch fields; omitted ones take their defaults
+
+        Returns:
+            The constructed MarketMatch
+        """
+        return cls.model_construct(**fields)
 
 
 class TradeProposal(BaseModel):
@@ -81,7 +102,7 @@ class TradeProposal(BaseModel):
     ticker: str
     title: str
     subtitle: str = Field(default="", description="Option name for multi-outcome markets (e.g., 'LeBron James')")
-    side: Literal["YES", "NO"]
+    side: TradeSide
     contracts: int = Field(gt=0, description="Number of contracts to buy")
     limit_price: int = Field(ge=1, le=99, description="Price per contract in cents")
     total_cost: float = Field(gt=0, description="Total cost in USD")
@@ -94,8 +115,9 @@ class TradeProposal(BaseModel):
     created_at: datetime
     expires_at: datetime = Field(description="When approval token expires")
     close_time: Optional[datetime] = Field(default=None, description="When market resolves")
+    close_time_str: str = Field(default="", description="close_time preformatted for display, e.g. 'Nov 05, 2024'")
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(frozen=True, json_schema_extra={
         "example": {
             "trade_id": "abc-123-def-456",
             "ticker": "PRES-2024-DJT",
@@ -113,7 +135,7 @@ class TradeProposal(BaseModel):
             "created_at": "2024-11-25T12:30:00Z",
             "expires_at": "2024-11-25T12:30:30Z"
         }
-    }}
+    })
 
 
 class ExecutedTrade(BaseModel):
@@ -124,14 +146,14 @@ class ExecutedTrade(BaseModel):
     trade_id: str = Field(description="Original proposal ID")
     order_id: str = Field(description="Kalshi order ID")
     ticker: str
-    side: Literal["YES", "NO"]
+    side: TradeSide
     contracts: int = Field(gt=0)
     fill_price: int = Field(ge=1, le=99, description="Actual fill price in cents")
     total_cost: float = Field(gt=0)
     executed_at: datetime
     reasoning: str = Field(description="Original reasoning for the trade")
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(frozen=True, json_schema_extra={
         "example": {
             "trade_id": "abc-123-def-456",
             "order_id": "kalshi-ord-789xyz",
@@ -143,7 +165,7 @@ class ExecutedTrade(BaseModel):
             "executed_at": "2024-11-25T12:30:15Z",
             "reasoning": "User conviction 85% vs market 53%"
         }
-    }}
+    })
 
 
 class Position(BaseModel):
@@ -153,7 +175,7 @@ class Position(BaseModel):
     """
     ticker: str
     title: str
-    side: Literal["YES", "NO"]
+    side: TradeSide
     contracts: int = Field(gt=0)
     avg_price: int = Field(ge=1, le=99, description="Average entry price in cents")
     current_price: int = Field(ge=1, le=99, description="Current market price")
@@ -162,7 +184,7 @@ class Position(BaseModel):
     close_time: Optional[datetime] = Field(default=None, description="When market resolves")
     cost_basis: float = Field(default=0.0, description="Total cost paid for position in USD")
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(frozen=True, json_schema_extra={
         "example": {
             "ticker": "PRES-2024-DJT",
             "title": "Will Trump win the 2024 election?",
@@ -175,7 +197,7 @@ class Position(BaseModel):
             "close_time": "2024-11-05T23:59:59Z",
             "cost_basis": 74.73
         }
-    }}
+    })
 
 
 class MarketResearch(BaseModel):
@@ -200,7 +222,7 @@ class MarketResearch(BaseModel):
     factors_for: list[str] = Field(description="Reasons event might happen")
     factors_against: list[str] = Field(description="Reasons event might not happen")
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(json_schema_extra={
         "example": {
             "ticker": "SPACEX-STARSHIP",
             "title": "Will SpaceX land Starship?",
@@ -217,7 +239,7 @@ class MarketResearch(BaseModel):
             "factors_for": ["Improved heat shield", "FAA cleared"],
             "factors_against": ["Previous failures", "Weather concerns"]
         }
-    }}
+    })
 
 
 class FairValueEstimate(BaseModel):
@@ -241,7 +263,7 @@ class FairValueEstimate(BaseModel):
     )
     reasoning: str = Field(description="Explanation of the estimate")
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(json_schema_extra={
         "example": {
             "estimated_probability": 65.0,
             "confidence": "medium",
@@ -249,4 +271,10 @@ class FairValueEstimate(BaseModel):
             "factors_against": ["Economic uncertainty", "Low turnout expected"],
             "reasoning": "Based on recent polls and historical patterns..."
         }
-    }}
+    })
+
+
+# Prebuilt validators for lists of models (e.g. API responses), so the
+# whole list is validated in one call with no per-call schema lookup
+MarketMatchListAdapter = TypeAdapter(list[MarketMatch])
+PositionListAdapter = TypeAdapter(list[Position])
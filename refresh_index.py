@@ -1,7 +1,15 @@
 #!/usr/bin/env python3
-"""Refresh the market index with fresh data from Kalshi API."""
+"""Refresh the market index with fresh data from Kalshi API.
 
+Syncs the existing index in place: only markets whose text changed are
+re-embedded, and prices are updated without re-embedding. Pass --force
+to rebuild from scratch.
+"""
+
+import argparse
+import os
 import shutil
+import threading
 from pathlib import Path
 
 from config import settings
@@ -9,21 +17,44 @@ from services.llama_index_service import LlamaIndexService
 from services.kalshi_client import KalshiClient
 
 
-def main():
-    # Delete old index
-    if settings.chroma_path.exists():
-        print(f"Deleting old index at {settings.chroma_path}...")
-        shutil.rmtree(settings.chroma_path)
+def discard_index(path: Path) -> None:
+    """Move the old index out of the way and delete it in the background.
+
+    The rename is instant, so indexing can start right away; the
+    (non-daemon) delete thread still finishes before the process exits.
+
+    Args:
+        path: Chroma persistence directory
+    """
+    trash = path.with_name(f"{path.name}.old-{os.getpid()}")
+    try:
+        path.rename(trash)
+    except OSError:
+        # Can't rename (e.g. cross-device mount) - delete in place
+        shutil.rmtree(path)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}).start()
 
-    # Initialize services
+
+def main(force: bool = False):
+    """Sync the index with the currently open markets.
+
+    Args:
+        force: Discard the index and rebuild it from scratch
+    """
     print("Connecting to Kalshi...")
     client = KalshiClient()
 
+    # Normally sync in place, so only changed markets are re-embedded;
+    # --force starts over from an empty index
+    if force and settings.chroma_path.exists():
+        print(f"Deleting old index at {settings.chroma_path}...")
+        discard_index(settings.chroma_path)
+
     print("Initializing index...")
     service = LlamaIndexService()
     service.init_index()
 
-    # Refresh with all markets
     print("Fetching and indexing markets (this may take a minute)...")
     count = service.refresh_index(client)
 
@@ -31,4 +62,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Discard the index and rebuild it from scratch"
+    )
+    main(force=parser.parse_args().force)
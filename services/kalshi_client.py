@@ -7,20 +7,30 @@ Handles all interactions with the Kalshi prediction market:
 """
 
 import httpx
+import orjson
+import random
 import time
 import base64
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
-from cryptography.hazmat.primitives import hashes, serialization
+from typing import Iterator, Optional
+from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.backends import default_backend
 
 from config import settings
+from services.parsing import clamp_price, parse_close_time
 
 logger = logging.getLogger(__name__)
 from models import MarketMatch, Position
 
+# Path prefix of every Kalshi API endpoint (and of every signed path)
+_API_PREFIX = "/trade-api/v2"
+
+# Pre-encoded HTTP methods for the signing message
+_METHOD_BYTES = {method: method.encode() for method in ("GET", "POST", "DELETE")}
+
 
 class KalshiError(Exception):
     """Base exception for Kalshi API errors."""
@@ -46,21 +56,53 @@ class KalshiClient:
             markets = client.get_markets(limit=10)
     """
 
+    # Tickers per batched /markets request, keeping the query string short
+    _QUOTE_BATCH_SIZE = 100
+
+    # Concurrent single-market lookups when a batched quote comes back short
+    _MAX_LOOKUP_WORKERS = 8
+
+    # Retries for transient failures (see _request)
+    _MAX_ATTEMPTS = 3
+    _RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+    # get_market results are reused for a few seconds (see get_market)
+    _MARKET_CACHE_TTL = 5.0
+    _MARKET_CACHE_SIZE = 2048
+
     def __init__(self):
         self.api_base = settings.kalshi_api_host
+        # Scheme + host only; _request adds the prefix back to every path
+        self._base_url = self.api_base.rstrip('/').removesuffix(_API_PREFIX)
         self.key_id = settings.kalshi_api_key_id
         self._private_key = None
-        self._client = httpx.Client(timeout=30.0)
+        # ticker -> (fetched_at monotonic, MarketMatch)
+        self._market_cache: dict[str, tuple[float, MarketMatch]] = {}
+        self._market_cache_lock = threading.Lock()
+        # Keep-alive pool sized for the concurrent lookups in get_positions
+        self._client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
         self._load_private_key()
 
     def _load_private_key(self):
-        """Load RSA private key from file."""
-        key_bytes = settings.get_private_key()
-        self._private_key = serialization.load_pem_private_key(
-            key_bytes,
-            password=None,
-            backend=default_backend()
+        """Load RSA private key (parsed once per process by settings).
+
+        Also builds the signing parameters and static auth headers, which
+        are the same for every request.
+        """
+        self._private_key = settings.load_private_key()
+        self._pss_padding = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH
         )
+        self._hash_algo = hashes.SHA256()
+        self._static_headers = {
+            "KALSHI-ACCESS-KEY": self.key_id,
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
 
     def _sign_request(self, method: str, path: str, timestamp: int) -> str:
         """Sign a request using RSA-PSS with SHA256.
@@ -76,18 +118,12 @@ class KalshiClient:
         Returns:
             Base64 encoded signature
         """
-        # Strip query params from path
-        path_without_query = path.split('?')[0]
-        message = f"{timestamp}{method}{path_without_query}".encode('utf-8')
-
-        signature = self._private_key.sign(
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256()
-        )
+        # Strip query params from path; build the message as bytes directly
+        path_without_query = path.split('?', 1)[0].encode('utf-8')
+        method_bytes = _METHOD_BYTES.get(method) or method.encode('utf-8')
+        message = b"%d%s%s" % (timestamp, method_bytes, path_without_query)
+
+        signature = self._private_key.sign(message, self._pss_padding, self._hash_algo)
         return base64.b64encode(signature).decode('utf-8')
 
     def _get_headers(self, method: str, path: str) -> dict:
@@ -104,16 +140,20 @@ class KalshiClient:
         signature = self._sign_request(method, path, timestamp)
 
         return {
-            "KALSHI-ACCESS-KEY": self.key_id,
+            **self._static_headers,
             "KALSHI-ACCESS-SIGNATURE": signature,
             "KALSHI-ACCESS-TIMESTAMP": str(timestamp),
-            "Content-Type": "application/json",
-            "Accept": "application/json"
         }
 
     def _request(self, method: str, endpoint: str, json: dict = None) -> dict:
         """Make authenticated request to Kalshi API.
 
+        Transient failures (429/502/503/504, connection errors) are retried
+        up to _MAX_ATTEMPTS times on the same keep-alive client, with a
+        short jittered backoff. Each attempt is signed afresh. POSTs are
+        only retried when Kalshi can't have acted on them (429, or the
+        connection was never made), so an order is never placed twice.
+
         Args:
             method: HTTP method (GET, POST, DELETE)
             endpoint: API endpoint (without /trade-api/v2 prefix)
@@ -126,34 +166,68 @@ class KalshiClient:
             KalshiAuthError: On 401 authentication failure
             KalshiError: On other API errors
         """
-        path = f"/trade-api/v2{endpoint}"
-        url = f"{self.api_base.rstrip('/trade-api/v2')}{path}"
-        headers = self._get_headers(method, path)
+        if method not in _METHOD_BYTES:
+            raise ValueError(f"Unsupported method: {method}")
 
-        try:
-            if method == "GET":
-                response = self._client.get(url, headers=headers, params=json)
-            elif method == "POST":
-                response = self._client.post(url, headers=headers, json=json)
-            elif method == "DELETE":
-                response = self._client.delete(url, headers=headers)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+        path = _API_PREFIX + endpoint
+        url = self._base_url + path
+        # Auth headers already carry Content-Type: application/json
+        body = orjson.dumps(json) if method == "POST" else None
 
-            if response.status_code == 401:
-                raise KalshiAuthError(
-                    "Authentication failed - check API key and private key"
-                )
+        for attempt in range(1, self._MAX_ATTEMPTS + 1):
+            # Signatures are timestamped, so sign every attempt
+            headers = self._get_headers(method, path)
+            last_attempt = attempt == self._MAX_ATTEMPTS
 
-            response.raise_for_status()
-            return response.json()
+            try:
+                if method == "GET":
+                    response = self._client.get(url, headers=headers, params=json)
+                elif method == "POST":
+                    response = self._client.post(url, headers=headers, content=body)
+                else:
+                    response = self._client.delete(url, headers=headers)
+            except httpx.RequestError as e:
+                never_sent = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not last_attempt and (method != "POST" or never_sent):
+                    logger.warning(f"Kalshi {method} {endpoint} failed ({type(e).__name__}), retrying")
+                    time.sleep(self._retry_delay(attempt))
+                    continue
+                raise KalshiError(f"Request failed: {str(e)}")
+
+            status = response.status_code
+            if (
+                status in self._RETRY_STATUSES and not last_attempt
+                and (method != "POST" or status == 429)
+            ):
+                logger.warning(f"Kalshi {method} {endpoint} returned {status}, retrying")
+                time.sleep(self._retry_delay(attempt))
+                continue
+            break
+
+        if response.status_code == 401:
+            raise KalshiAuthError(
+                "Authentication failed - check API key and private key"
+            )
 
+        try:
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise KalshiError(
                 f"API error {e.response.status_code}: {e.response.text}"
             )
-        except httpx.RequestError as e:
-            raise KalshiError(f"Request failed: {str(e)}")
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Backoff before the next retry: 0.2s, 0.4s, ... up to 2s, plus jitter.
+
+        Args:
+            attempt: 1-based number of the attempt that just failed
+
+        Returns:
+            Seconds to sleep
+        """
+        return min(2.0, 0.2 * 2 ** (attempt - 1) + random.uniform(0, 0.1))
 
     # =========================================================================
     # Portfolio Methods
@@ -179,28 +253,35 @@ class KalshiClient:
         response = self._request("GET", "/portfolio/positions")
         positions_data = response.get("market_positions", [])
 
+        # Kalshi also lists closed (0 contract) positions; drop them up front
+        open_positions = [pos for pos in positions_data if pos.get("position", 0)]
+
+        # Quote every open position's market in one batched call, then look
+        # up anything the batch missed concurrently rather than one by one
+        tickers = [pos["ticker"] for pos in open_positions]
+        quotes = self.get_markets_by_ticker(tickers)
+        quotes.update(self._get_markets_concurrently(
+            [ticker for ticker in tickers if ticker not in quotes]
+        ))
+
         positions = []
-        for pos in positions_data:
+        for pos in open_positions:
             ticker = pos["ticker"]
-            contracts = abs(pos.get("position", 0))
+            position = pos["position"]
+            contracts = abs(position)
 
-            # Skip closed positions (0 contracts)
-            if contracts == 0:
-                continue
+            # Positive position = YES contracts, negative = NO
+            is_yes = position > 0
 
             # Get current price and market details for P&L calculation
-            market = None
             close_time = None
             market_title = pos.get("market_title", ticker)
-            try:
-                market = self.get_market(ticker)
-                current_price = (
-                    market.yes_price if pos.get("position", 0) > 0
-                    else market.no_price
-                )
+            market = quotes.get(ticker)
+            if market is not None:
+                current_price = market.yes_price if is_yes else market.no_price
                 close_time = market.close_time
                 market_title = market.title  # Use full title from market
-            except KalshiError:
+            else:
                 current_price = 50  # Default if can't fetch
 
             avg_price = pos.get("average_price", 50)
@@ -208,17 +289,16 @@ class KalshiClient:
             # Calculate value and P&L
             current_value = contracts * current_price / 100
             cost_basis = contracts * avg_price / 100
-            unrealized_pnl = current_value - cost_basis
 
             positions.append(Position(
                 ticker=ticker,
                 title=market_title,
-                side="YES" if pos.get("position", 0) > 0 else "NO",
+                side="YES" if is_yes else "NO",
                 contracts=contracts,
                 avg_price=avg_price,
                 current_price=current_price,
                 current_value=current_value,
-                unrealized_pnl=unrealized_pnl,
+                unrealized_pnl=current_value - cost_basis,
                 close_time=close_time,
                 cost_basis=cost_basis
             ))
@@ -270,6 +350,21 @@ class KalshiClient:
             Complete list of markets
         """
         all_markets = []
+        for markets in self.iter_market_pages(status=status):
+            all_markets.extend(markets)
+        return all_markets
+
+    def iter_market_pages(self, status: str = "open") -> Iterator[list[dict]]:
+        """Iterate over all markets one page (up to 1000) at a time.
+
+        Lets callers start processing a page before the next is fetched.
+
+        Args:
+            status: "open", "closed", or "settled"
+
+        Yields:
+            Lists of market dicts, one per page
+        """
         cursor = None
 
         while True:
@@ -283,14 +378,13 @@ class KalshiClient:
             response = self._request("GET", "/markets", json=params)
 
             markets = response.get("markets", [])
-            all_markets.extend(markets)
+            if markets:
+                yield markets
 
             cursor = response.get("cursor")
             if not cursor or len(markets) < 1000:
                 break
 
-        return all_markets
-
     def get_event(self, event_ticker: str) -> list[MarketMatch]:
         """Get all markets in an event by event ticker.
 
@@ -310,33 +404,27 @@ class KalshiClient:
 
         markets = []
         for market in markets_data:
-            # Parse close_time
-            close_time_str = market.get("close_time", "")
-            try:
-                close_time = datetime.fromisoformat(
-                    close_time_str.replace("Z", "+00:00")
-                )
-            except (ValueError, TypeError):
-                close_time = datetime.now(timezone.utc)
+            get = market.get
+            close_time = parse_close_time(get("close_time")) or datetime.now(timezone.utc)
 
             # Use ASK prices for buying
-            yes_price = market.get("yes_ask", 50) or market.get("yes_bid", 50) or 50
-            no_price = market.get("no_ask", 50) or market.get("no_bid", 50) or 50
-            yes_price = max(1, min(99, yes_price))
-            no_price = max(1, min(99, no_price))
+            yes_price = get("yes_ask", 50) or get("yes_bid", 50) or 50
+            no_price = get("no_ask", 50) or get("no_bid", 50) or 50
+            yes_price = clamp_price(yes_price)
+            no_price = clamp_price(no_price)
 
             # Get subtitle - prefer yes_sub_title for multi-outcome markets
-            subtitle = market.get("subtitle") or market.get("yes_sub_title", "")
+            subtitle = get("subtitle") or get("yes_sub_title", "")
 
             markets.append(MarketMatch(
                 ticker=market["ticker"],
                 event_ticker=event_ticker,
-                title=market.get("title", ""),
+                title=get("title", ""),
                 subtitle=subtitle,
                 category=event.get("category", ""),
                 yes_price=yes_price,
                 no_price=no_price,
-                volume=market.get("volume", 0),
+                volume=get("volume", 0),
                 close_time=close_time,
                 relevance_score=0.0
             ))
@@ -348,6 +436,10 @@ class KalshiClient:
     def get_market(self, ticker: str) -> MarketMatch:
         """Get single market by ticker with current prices.
 
+        Results are cached per ticker for _MARKET_CACHE_TTL seconds, so
+        repeated lookups in quick succession cost one signed request.
+        Placing an order on a ticker drops its cached entry.
+
         Args:
             ticker: Market ticker (e.g., "PRES-2024-DJT")
 
@@ -357,37 +449,120 @@ class KalshiClient:
         Raises:
             KalshiError: If market not found
         """
+        now = time.monotonic()
+        with self._market_cache_lock:
+            cached = self._market_cache.get(ticker)
+        if cached is not None and now - cached[0] < self._MARKET_CACHE_TTL:
+            return cached[1]
+
         response = self._request("GET", f"/markets/{ticker}")
-        market = response.get("market", {})
+        market = self._parse_market(response.get("market", {}))
 
-        # Parse close_time - handle different formats
-        close_time_str = market.get("close_time", "")
-        try:
-            close_time = datetime.fromisoformat(
-                close_time_str.replace("Z", "+00:00")
-            )
-        except (ValueError, TypeError):
-            close_time = datetime.now(timezone.utc)
+        with self._market_cache_lock:
+            if ticker not in self._market_cache and len(self._market_cache) >= self._MARKET_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._market_cache[next(iter(self._market_cache))]
+            self._market_cache.pop(ticker, None)
+            self._market_cache[ticker] = (now, market)
+        return market
+
+    def invalidate_market(self, ticker: str) -> None:
+        """Drop a ticker's cached get_market result.
+
+        Args:
+            ticker: Market ticker
+        """
+        with self._market_cache_lock:
+            self._market_cache.pop(ticker, None)
+
+    def get_markets_by_ticker(self, tickers: list[str]) -> dict[str, MarketMatch]:
+        """Get several markets by ticker, batching them into few requests.
+
+        Args:
+            tickers: Market tickers to look up (duplicates are fetched once)
+
+        Returns:
+            Dict of ticker -> MarketMatch; tickers Kalshi didn't return are absent
+        """
+        unique = list(dict.fromkeys(tickers))
+        markets = {}
+        for i in range(0, len(unique), self._QUOTE_BATCH_SIZE):
+            batch = unique[i:i + self._QUOTE_BATCH_SIZE]
+            try:
+                response = self._request(
+                    "GET", "/markets",
+                    json={"tickers": ",".join(batch), "limit": len(batch)}
+                )
+            except KalshiError as e:
+                # Callers fall back to per-ticker lookups for anything missing
+                logger.warning(f"Batched market lookup failed: {e}")
+                continue
+            for market in response.get("markets", []):
+                if market.get("ticker"):
+                    markets[market["ticker"]] = self._parse_market(market)
+        return markets
+
+    def _get_markets_concurrently(self, tickers: list[str]) -> dict[str, MarketMatch]:
+        """Look up markets one by one, with the requests in flight together.
+
+        Args:
+            tickers: Market tickers to look up (duplicates are fetched once)
+
+        Returns:
+            Dict of ticker -> MarketMatch; tickers that failed are absent
+        """
+        unique = list(dict.fromkeys(tickers))
+        if not unique:
+            return {}
+
+        def lookup(ticker: str) -> Optional[MarketMatch]:
+            try:
+                return self.get_market(ticker)
+            except KalshiError as e:
+                logger.warning(f"Market lookup failed for {ticker}: {e}")
+                return None
+
+        workers = min(self._MAX_LOOKUP_WORKERS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lookup, unique)
+            return {
+                ticker: market
+                for ticker, market in zip(unique, results)
+                if market is not None
+            }
+
+    @staticmethod
+    def _parse_market(market: dict) -> MarketMatch:
+        """Build a MarketMatch from a Kalshi market dict.
+
+        Args:
+            market: Market object as returned by the /markets endpoints
+
+        Returns:
+            MarketMatch with current data
+        """
+        get = market.get
+        close_time = parse_close_time(get("close_time")) or datetime.now(timezone.utc)
 
         # Use ASK prices (what you pay to buy), not BID prices (what you get to sell)
         # This ensures limit orders fill immediately
-        yes_price = market.get("yes_ask", 50) or market.get("yes_bid", 50) or 50
-        no_price = market.get("no_ask", 50) or market.get("no_bid", 50) or 50
-        yes_price = max(1, min(99, yes_price))
-        no_price = max(1, min(99, no_price))
+        yes_price = get("yes_ask", 50) or get("yes_bid", 50) or 50
+        no_price = get("no_ask", 50) or get("no_bid", 50) or 50
+        yes_price = clamp_price(yes_price)
+        no_price = clamp_price(no_price)
 
         # Get subtitle - prefer yes_sub_title for multi-outcome markets (e.g., "LeBron James")
-        subtitle = market.get("subtitle") or market.get("yes_sub_title", "")
+        subtitle = get("subtitle") or get("yes_sub_title", "")
 
         return MarketMatch(
             ticker=market["ticker"],
-            event_ticker=market.get("event_ticker", ""),
-            title=market.get("title", ""),
+            event_ticker=get("event_ticker", ""),
+            title=get("title", ""),
             subtitle=subtitle,
-            category=market.get("category", ""),
+            category=get("category", ""),
             yes_price=yes_price,
             no_price=no_price,
-            volume=market.get("volume", 0),
+            volume=get("volume", 0),
             close_time=close_time,
             relevance_score=0.0  # Not from search
         )
@@ -440,7 +615,11 @@ class KalshiClient:
             price_key = "yes_price" if side.lower() == "yes" else "no_price"
             order_data[price_key] = price
 
-        response = self._request("POST", "/portfolio/orders", json=order_data)
+        try:
+            response = self._request("POST", "/portfolio/orders", json=order_data)
+        finally:
+            # The order may have moved the book either way
+            self.invalidate_market(ticker)
         order = response.get("order", response)
 
         # Log order details for debugging
@@ -7,7 +7,13 @@ Provides:
 - Persistent storage via ChromaDB
 """
 
-from typing import Optional
+import hashlib
+import json
+import logging
+import queue
+import threading
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
 from datetime import datetime, timezone
 
 import chromadb
@@ -15,25 +21,56 @@ from chromadb.config import Settings as ChromaSettings
 
 from llama_index.core import VectorStoreIndex, Document, StorageContext
 from llama_index.core.settings import Settings as LlamaSettings
+from llama_index.core.vector_stores import (
+    FilterCondition,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
 from llama_index.vector_stores.chroma import ChromaVectorStore
 
 from config import settings
 from models import MarketMatch
+from services.parsing import clamp_price, parse_close_time
 
+logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
 def _get_embed_model():
     """Get embedding model - uses HuggingFace (free) by default.
 
-    Falls back to OpenAI if configured and HuggingFace fails.
+    Falls back to OpenAI if configured and HuggingFace fails. Loaded once
+    per process: every LlamaIndexService (server, frontend standalone
+    mode, refresh script) shares the same model.
     """
     # Try HuggingFace first (free, no API key needed)
     try:
         from llama_index.embeddings.huggingface import HuggingFaceEmbedding
-        return HuggingFaceEmbedding(
-            model_name="BAAI/bge-small-en-v1.5"  # Fast, good quality, ~130MB
-        )
     except ImportError:
         pass
+    else:
+        # settings.embed_backend="onnx" runs the model through ONNX Runtime,
+        # typically several times faster on CPU; only passed when set so
+        # older integrations without the option keep working
+        backend = settings.embed_backend.lower()
+        extra = {"backend": backend} if backend != "torch" else {}
+        try:
+            return HuggingFaceEmbedding(
+                model_name="BAAI/bge-small-en-v1.5",  # Fast, good quality, ~130MB
+                # Default is 10; bigger batches keep the matmuls busy when
+                # indexing thousands of markets (device is auto-detected)
+                embed_batch_size=64,
+                **extra
+            )
+        except Exception as e:
+            if not extra:
+                raise
+            logger.warning(f"Embedding backend '{backend}' unavailable ({e}), using torch")
+            return HuggingFaceEmbedding(
+                model_name="BAAI/bge-small-en-v1.5",
+                embed_batch_size=64
+            )
 
     # Fall back to OpenAI if available
     if settings.openai_api_key:
@@ -49,6 +86,57 @@ def _get_embed_model():
     )
 
 
+def _prefetch(batches: Iterable[list[dict]], depth: int = 2) -> Iterator[list[dict]]:
+    """Iterate over batches produced ahead of time on a background thread.
+
+    While the caller works on one batch (e.g. embedding it), the next
+    ones (e.g. Kalshi pages) are already being fetched. Errors raised
+    by the producer are re-raised in the caller.
+
+    Args:
+        batches: Iterable of batches, consumed on the background thread
+        depth: Maximum number of batches buffered ahead of the caller
+
+    Yields:
+        The batches, in order
+    """
+    done = object()
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+        except BaseException as e:
+            put(e)
+            return
+        put(done)
+
+    threading.Thread(target=produce, name="index-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Unblock the producer if the caller stopped early
+        stop.set()
+
+
 class LlamaIndexService:
     """Semantic search service for Kalshi markets using LlamaIndex + ChromaDB.
 
@@ -66,10 +154,17 @@ class LlamaIndexService:
 
     COLLECTION_NAME = "kalshi_markets"
 
+    # Market fields that change between refreshes without changing what the
+    # market is about; kept out of the embedding and updated in place
+    _LIVE_METADATA_KEYS = (
+        'yes_price', 'no_price', 'volume', 'close_time', 'close_timestamp', 'status'
+    )
+
     def __init__(self):
         self.chroma_client: Optional[chromadb.PersistentClient] = None
         self.collection = None
         self.vector_store: Optional[ChromaVectorStore] = None
+        self._storage_context: Optional[StorageContext] = None
         self.index: Optional[VectorStoreIndex] = None
         self._initialized = False
 
@@ -97,8 +192,12 @@ class LlamaIndexService:
             metadata={"description": "Kalshi prediction markets"}
         )
 
-        # Create vector store from collection
+        # Create vector store from collection, and one storage context
+        # around it for every index built over it
         self.vector_store = ChromaVectorStore(chroma_collection=self.collection)
+        self._storage_context = StorageContext.from_defaults(
+            vector_store=self.vector_store
+        )
 
         # Configure LlamaIndex embeddings (HuggingFace by default, free & local)
         LlamaSettings.embed_model = _get_embed_model()
@@ -106,45 +205,29 @@ class LlamaIndexService:
         # Check if we have existing data
         if self.collection.count() > 0:
             # Load existing index
-            storage_context = StorageContext.from_defaults(
-                vector_store=self.vector_store
-            )
             self.index = VectorStoreIndex.from_vector_store(
                 vector_store=self.vector_store,
-                storage_context=storage_context
+                storage_context=self._storage_context
             )
 
         self._initialized = True
         return self.collection.count()
 
-    def index_markets(self, markets: list[dict], clear_existing: bool = True) -> int:
-        """Index markets for semantic search.
+    @staticmethod
+    def _market_document(market: dict) -> Document:
+        """Build the searchable Document for one Kalshi market.
 
         Args:
-            markets: List of market dicts from Kalshi API
-            clear_existing: Whether to clear existing index first
+            market: Market dict from Kalshi API
 
         Returns:
-            Number of markets indexed
+            Document keyed by ticker, with price/close-time metadata
         """
-        if not self._initialized:
-            self.init_index()
+        # Get subtitle - prefer yes_sub_title for multi-outcome markets (e.g., "LeBron James")
+        subtitle = market.get('subtitle') or market.get('yes_sub_title', '')
 
-        if clear_existing and self.collection.count() > 0:
-            # Delete all documents in collection
-            # ChromaDB requires IDs to delete, so we get all IDs first
-            existing = self.collection.get()
-            if existing["ids"]:
-                self.collection.delete(ids=existing["ids"])
-
-        # Create documents from markets
-        documents = []
-        for market in markets:
-            # Get subtitle - prefer yes_sub_title for multi-outcome markets (e.g., "LeBron James")
-            subtitle = market.get('subtitle') or market.get('yes_sub_title', '')
-
-            # Combine searchable text (include yes_sub_title for player name searches)
-            text = f"""
+        # Combine searchable text (include yes_sub_title for player name searches)
+        text = f"""
             {market.get('title', '')}
             {subtitle}
             {market.get('yes_sub_title', '')}
@@ -152,58 +235,193 @@ class LlamaIndexService:
             {market.get('rules_primary', '')}
             """.strip()
 
-            # Parse close_time safely
-            close_time = market.get('close_time', '')
-            if close_time:
-                try:
-                    close_dt = datetime.fromisoformat(
-                        close_time.replace('Z', '+00:00')
-                    )
-                    close_timestamp = close_dt.timestamp()
-                except (ValueError, TypeError):
-                    close_timestamp = 0
-            else:
-                close_timestamp = 0
-
-            # Clamp prices to valid range (1-99), default to 50 if missing/zero
-            yes_price = market.get('yes_bid', 50) or 50
-            no_price = market.get('no_bid', 50) or 50
-            yes_price = max(1, min(99, yes_price))
-            no_price = max(1, min(99, no_price))
-
-            doc = Document(
-                text=text,
-                doc_id=market['ticker'],
-                metadata={
-                    'ticker': market['ticker'],
-                    'event_ticker': market.get('event_ticker', ''),
-                    'title': market.get('title', ''),
-                    'subtitle': subtitle,
-                    'category': market.get('category', ''),
-                    'yes_price': yes_price,
-                    'no_price': no_price,
-                    'volume': market.get('volume', 0),
-                    'close_time': close_time,
-                    'close_timestamp': close_timestamp,
-                    'status': market.get('status', 'open')
-                }
-            )
-            documents.append(doc)
+        # Store the close time as a timestamp too, for filtering
+        close_time = market.get('close_time', '')
+        close_dt = parse_close_time(close_time)
+        close_timestamp = close_dt.timestamp() if close_dt else 0
+
+        # Clamp prices to valid range (1-99), default to 50 if missing/zero
+        yes_price = market.get('yes_bid', 50) or 50
+        no_price = market.get('no_bid', 50) or 50
+        yes_price = clamp_price(yes_price)
+        no_price = clamp_price(no_price)
+
+        metadata = {
+            # Identity and descriptive fields: embedded along with the text
+            'ticker': market['ticker'],
+            'event_ticker': market.get('event_ticker', ''),
+            'title': market.get('title', ''),
+            'subtitle': subtitle,
+            'category': market.get('category', ''),
+            # Live fields (see _LIVE_METADATA_KEYS): stored, not embedded
+            'yes_price': yes_price,
+            'no_price': no_price,
+            'volume': market.get('volume', 0),
+            'close_time': close_time,
+            'close_timestamp': close_timestamp,
+            'status': market.get('status', 'open')
+        }
+        # Fingerprint of exactly what gets embedded, so a re-index only
+        # re-embeds markets whose searchable content changed (see
+        # index_market_batches); live fields are updated in place
+        metadata['content_hash'] = hashlib.blake2b(
+            repr((text, [
+                (key, value) for key, value in metadata.items()
+                if key not in LlamaIndexService._LIVE_METADATA_KEYS
+            ])).encode('utf-8'),
+            digest_size=8
+        ).hexdigest()
+
+        return Document(
+            text=text,
+            doc_id=market['ticker'],
+            metadata=metadata,
+            excluded_embed_metadata_keys=[
+                *LlamaIndexService._LIVE_METADATA_KEYS, 'content_hash'
+            ],
+            excluded_llm_metadata_keys=['content_hash']
+        )
 
-        if not documents:
-            return 0
+    def index_markets(self, markets: list[dict], clear_existing: bool = True) -> int:
+        """Index markets for semantic search.
 
-        # Build index from documents
-        storage_context = StorageContext.from_defaults(
-            vector_store=self.vector_store
-        )
-        self.index = VectorStoreIndex.from_documents(
-            documents,
-            storage_context=storage_context,
-            show_progress=True
-        )
+        Args:
+            markets: List of market dicts from Kalshi API
+            clear_existing: Replace the existing index contents (only
+                changed markets are re-embedded; see index_market_batches)
 
-        return len(documents)
+        Returns:
+            Number of markets indexed
+        """
+        return self.index_market_batches([markets], clear_existing=clear_existing)
+
+    def _indexed_markets(self) -> dict[str, list[tuple[str, dict]]]:
+        """Map each indexed ticker to its Chroma entries.
+
+        Returns:
+            Dict of ticker -> [(Chroma id, stored metadata), ...]
+        """
+        existing = self.collection.get(include=["metadatas"])
+        indexed: dict[str, list[tuple[str, dict]]] = {}
+        for chroma_id, meta in zip(existing["ids"], existing["metadatas"]):
+            ticker = (meta or {}).get('ticker')
+            if ticker is None:
+                continue
+            indexed.setdefault(ticker, []).append((chroma_id, meta))
+        return indexed
+
+    @staticmethod
+    def _refreshed_metadata(stored: dict, metadata: dict) -> dict:
+        """Stored Chroma metadata with the market fields replaced.
+
+        LlamaIndex keeps a JSON copy of each node (metadata included)
+        under _node_content and rebuilds search results from it, so that
+        copy is updated along with the flat keys Chroma filters on.
+
+        Args:
+            stored: Metadata currently stored in Chroma for one entry
+            metadata: Fresh market metadata from _market_document
+
+        Returns:
+            Metadata to write back with collection.update
+        """
+        updated = {**stored, **metadata}
+        node_content = stored.get('_node_content')
+        if node_content:
+            node = json.loads(node_content)
+            node['metadata'] = {**node.get('metadata', {}), **metadata}
+            updated['_node_content'] = json.dumps(node)
+        return updated
+
+    def index_market_batches(
+        self,
+        batches: Iterable[list[dict]],
+        clear_existing: bool = True
+    ) -> int:
+        """Index markets batch by batch as they arrive.
+
+        Each batch is embedded and written to the vector store before the
+        next one is pulled, so a lazily fetched source (see refresh_index)
+        is consumed while indexing progresses.
+
+        With clear_existing, the index is synced to exactly the given
+        markets without re-embedding what hasn't changed: markets whose
+        content_hash (the embedded text) matches are kept, with only
+        their live fields (prices, volume, close time, status) updated
+        in place; changed markets are replaced and re-embedded; markets
+        no longer present are deleted.
+
+        Args:
+            batches: Iterable of market dict lists from Kalshi API
+            clear_existing: Replace the existing index contents
+
+        Returns:
+            Number of markets indexed
+        """
+        if not self._initialized:
+            self.init_index()
+
+        indexed = self._indexed_markets() if clear_existing else {}
+        seen = set()
+
+        count = 0
+        embedded = 0
+        updated = 0
+        for markets in batches:
+            documents = []
+            stale_ids = []
+            update_ids = []
+            update_metadatas = []
+            for market in markets:
+                document = self._market_document(market)
+                metadata = document.metadata
+                ticker = market['ticker']
+                seen.add(ticker)
+                entries = indexed.get(ticker, ())
+                if entries and all(
+                    stored.get('content_hash') == metadata['content_hash']
+                    for _, stored in entries
+                ):
+                    # Same embedding; refresh live fields if they moved
+                    for chroma_id, stored in entries:
+                        if any(stored.get(key) != value for key, value in metadata.items()):
+                            update_ids.append(chroma_id)
+                            update_metadatas.append(self._refreshed_metadata(stored, metadata))
+                    continue
+                stale_ids.extend(chroma_id for chroma_id, _ in entries)
+                documents.append(document)
+            count += len(markets)
+
+            if update_ids:
+                self.collection.update(ids=update_ids, metadatas=update_metadatas)
+                updated += len(update_ids)
+            if stale_ids:
+                self.collection.delete(ids=stale_ids)
+            if not documents:
+                continue
+            # Every batch lands in the same Chroma collection, so the last
+            # index built sees all of them
+            self.index = VectorStoreIndex.from_documents(
+                documents,
+                storage_context=self._storage_context,
+                show_progress=True
+            )
+            embedded += len(documents)
+
+        # Drop markets that are no longer listed
+        removed = [
+            chroma_id
+            for ticker, entries in indexed.items() if ticker not in seen
+            for chroma_id, _ in entries
+        ]
+        if removed:
+            self.collection.delete(ids=removed)
+
+        logger.info(
+            f"Indexed {count} markets: {embedded} embedded, {updated} "
+            f"entries with updated prices, {len(removed)} stale entries removed"
+        )
+        return count
 
     def search_markets(
         self,
@@ -226,9 +444,32 @@ class LlamaIndexService:
         if not self._initialized or self.index is None:
             return []
 
-        # Build retriever - get extra for filtering
+        # The active-market filter runs inside Chroma, so closed markets
+        # never take up result slots. Markets indexed without a close time
+        # (close_timestamp 0) are kept, as before.
+        filters = None
+        if only_active:
+            filters = MetadataFilters(
+                filters=[
+                    MetadataFilter(
+                        key="close_timestamp",
+                        value=datetime.now(timezone.utc).timestamp(),
+                        operator=FilterOperator.GTE
+                    ),
+                    MetadataFilter(
+                        key="close_timestamp",
+                        value=0,
+                        operator=FilterOperator.EQ
+                    ),
+                ],
+                condition=FilterCondition.OR
+            )
+
+        # Build retriever - get extra for the (case-insensitive, so
+        # Python-side) category filter
         retriever = self.index.as_retriever(
-            similarity_top_k=n_results * 3
+            similarity_top_k=n_results * 3 if category else n_results,
+            filters=filters
         )
 
         # Execute search
@@ -236,45 +477,33 @@ class LlamaIndexService:
 
         # Filter and convert results
         results = []
-        now_timestamp = datetime.now(timezone.utc).timestamp()
+        category_lower = category.lower() if category else None
 
         for node in nodes:
             meta = node.metadata
-
-            # Filter by active status
-            if only_active:
-                close_ts = meta.get('close_timestamp', 0)
-                if close_ts and close_ts < now_timestamp:
-                    continue
+            get = meta.get  # Bound once for the per-node field lookups below
 
             # Filter by category
-            if category and meta.get('category', '').lower() != category.lower():
+            if category_lower and (get('category') or '').lower() != category_lower:
                 continue
 
-            # Parse close_time
-            close_time_str = meta.get('close_time', '')
-            try:
-                close_time = datetime.fromisoformat(
-                    close_time_str.replace('Z', '+00:00')
-                )
-            except (ValueError, TypeError):
-                close_time = datetime.now(timezone.utc)
+            close_time = parse_close_time(get('close_time')) or datetime.now(timezone.utc)
 
             # Clamp prices to valid range (1-99)
-            yes_price = max(1, min(99, meta.get('yes_price', 50) or 50))
-            no_price = max(1, min(99, meta.get('no_price', 50) or 50))
+            yes_price = clamp_price(get('yes_price', 50) or 50)
+            no_price = clamp_price(get('no_price', 50) or 50)
 
-            results.append(MarketMatch(
+            results.append(MarketMatch.fast_build(
                 ticker=meta['ticker'],
-                event_ticker=meta.get('event_ticker', ''),
-                title=meta.get('title', ''),
-                subtitle=meta.get('subtitle', ''),
-                category=meta.get('category', ''),
+                event_ticker=get('event_ticker', ''),
+                title=get('title', ''),
+                subtitle=get('subtitle', ''),
+                category=get('category', ''),
                 yes_price=yes_price,
                 no_price=no_price,
-                volume=meta.get('volume', 0),
+                volume=get('volume', 0),
                 close_time=close_time,
-                relevance_score=node.score if node.score else 0.0
+                relevance_score=max(0.0, min(1.0, node.score or 0.0))
             ))
 
             if len(results) >= n_results:
@@ -306,29 +535,23 @@ class LlamaIndexService:
             return None
 
         meta = results['metadatas'][0]
+        get = meta.get
 
-        # Parse close_time
-        close_time_str = meta.get('close_time', '')
-        try:
-            close_time = datetime.fromisoformat(
-                close_time_str.replace('Z', '+00:00')
-            )
-        except (ValueError, TypeError):
-            close_time = datetime.now(timezone.utc)
+        close_time = parse_close_time(get('close_time')) or datetime.now(timezone.utc)
 
         # Clamp prices to valid range (1-99)
-        yes_price = max(1, min(99, meta.get('yes_price', 50) or 50))
-        no_price = max(1, min(99, meta.get('no_price', 50) or 50))
+        yes_price = clamp_price(get('yes_price', 50) or 50)
+        no_price = clamp_price(get('no_price', 50) or 50)
 
         return MarketMatch(
             ticker=meta['ticker'],
-            event_ticker=meta.get('event_ticker', ''),
-            title=meta.get('title', ''),
-            subtitle=meta.get('subtitle', ''),
-            category=meta.get('category', ''),
+            event_ticker=get('event_ticker', ''),
+            title=get('title', ''),
+            subtitle=get('subtitle', ''),
+            category=get('category', ''),
             yes_price=yes_price,
             no_price=no_price,
-            volume=meta.get('volume', 0),
+            volume=get('volume', 0),
             close_time=close_time,
             relevance_score=1.0  # Exact match
         )
@@ -336,15 +559,18 @@ class LlamaIndexService:
     def refresh_index(self, kalshi_client) -> int:
         """Refresh index with current markets from Kalshi.
 
+        Market pages are fetched on a background thread while the
+        previous page is being embedded, so network and embedding time
+        overlap instead of adding up.
+
         Args:
             kalshi_client: KalshiClient instance
 
         Returns:
             Number of markets indexed
         """
-        markets = kalshi_client.get_all_markets(status="open")
-        count = self.index_markets(markets, clear_existing=True)
-        return count
+        pages = _prefetch(kalshi_client.iter_market_pages(status="open"))
+        return self.index_market_batches(pages, clear_existing=True)
 
     def get_stats(self) -> dict:
         """Get index statistics.
@@ -0,0 +1,49 @@
+"""Parsing helpers shared by the Kalshi client and the market index.
+
+Kalshi timestamps are ISO 8601 strings in UTC with a trailing "Z"
+(e.g. "2024-11-05T23:59:59Z"); prices are integer cents.
+"""
+
+import sys
+from datetime import datetime
+from typing import Optional
+
+# Fastest available ISO 8601 parser: ciso8601 if installed, otherwise
+# datetime.fromisoformat, which accepts the "Z" suffix as of Python 3.11
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_iso = datetime.fromisoformat
+    else:
+        def _parse_iso(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def parse_close_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Kalshi timestamp such as a market's close_time.
+
+    Args:
+        value: ISO 8601 string, e.g. "2024-11-05T23:59:59Z"
+
+    Returns:
+        Timezone-aware datetime, or None if value is empty or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return _parse_iso(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def clamp_price(cents: int) -> int:
+    """Clamp a price to the valid contract range of 1-99 cents.
+
+    Args:
+        cents: Price in cents
+
+    Returns:
+        The price, limited to 1..99
+    """
+    return 1 if cents < 1 else 99 if cents > 99 else cents
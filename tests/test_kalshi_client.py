@@ -0,0 +1,122 @@
+"""Kalshi client tests: request retries
+
+Run with: pytest tests/test_kalshi_client.py -v
+"""
+
+import base64
+import itertools
+
+import httpx
+import orjson
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+import services.kalshi_client as kalshi_client
+from config import settings
+from services.kalshi_client import KalshiClient, KalshiError
+
+
+@pytest.fixture(scope='module')
+def private_key():
+    """Throwaway RSA key to sign test requests with."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def client(monkeypatch, private_key):
+    """KalshiClient with a test key, no backoff sleeps and a ticking clock."""
+    monkeypatch.setattr(settings, '_private_key', private_key)
+    monkeypatch.setattr(kalshi_client.time, 'sleep', lambda seconds: None)
+    clock = itertools.count(1_700_000_000)
+    monkeypatch.setattr(kalshi_client.time, 'time', lambda: next(clock))
+    client = KalshiClient()
+    yield client
+    client.close()
+
+
+def serve(client, outcomes):
+    """Answer the client's requests with outcomes, in order.
+
+    Args:
+        client: KalshiClient whose transport is replaced
+        outcomes: HTTP status codes to respond with, or exceptions to raise
+
+    Returns:
+        List of the requests received
+    """
+    requests = []
+    outcomes = iter(outcomes)
+
+    def handler(request):
+        requests.append(request)
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, content=orjson.dumps({'ok': True}))
+
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return requests
+
+
+def assert_signed(request, public_key):
+    """Assert the request carries a valid signature for its own timestamp."""
+    timestamp = request.headers['KALSHI-ACCESS-TIMESTAMP']
+    message = f"{timestamp}{request.method}{request.url.path}".encode()
+    public_key.verify(
+        base64.b64decode(request.headers['KALSHI-ACCESS-SIGNATURE']),
+        message,
+        padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
+        hashes.SHA256(),
+    )
+
+
+class TestRequestRetries:
+    """Test which failures _request retries."""
+
+    def test_get_retried_on_503_with_fresh_signature(self, client, private_key):
+        requests = serve(client, [503, 200])
+
+        assert client._request('GET', '/portfolio/balance') == {'ok': True}
+
+        assert len(requests) == 2
+        timestamps = {r.headers['KALSHI-ACCESS-TIMESTAMP'] for r in requests}
+        assert len(timestamps) == 2, 'Each attempt must be signed afresh'
+        for request in requests:
+            assert_signed(request, private_key.public_key())
+
+    @pytest.mark.parametrize('outcome', [
+        502,
+        504,
+        httpx.ReadTimeout('read timed out'),
+    ], ids=['502', '504', 'read-timeout'])
+    def test_post_not_retried_when_order_may_have_been_placed(self, client, outcome):
+        requests = serve(client, [outcome, 200])
+
+        with pytest.raises(KalshiError):
+            client._request('POST', '/portfolio/orders', json={'ticker': 'TEST'})
+
+        assert len(requests) == 1
+
+    @pytest.mark.parametrize('outcome', [
+        429,
+        httpx.ConnectError('connection refused'),
+    ], ids=['429', 'connect-error'])
+    def test_post_retried_when_never_processed(self, client, outcome):
+        requests = serve(client, [outcome, 200])
+
+        assert client._request('POST', '/portfolio/orders', json={'ticker': 'TEST'}) == {'ok': True}
+
+        assert len(requests) == 2
+
+    @pytest.mark.parametrize('outcome, message', [
+        (503, 'API error 503'),
+        (httpx.ConnectError('connection refused'), 'Request failed'),
+    ], ids=['503', 'connect-error'])
+    def test_final_failure_raised_after_last_attempt(self, client, outcome, message):
+        requests = serve(client, [outcome] * KalshiClient._MAX_ATTEMPTS)
+
+        with pytest.raises(KalshiError, match=message):
+            client._request('GET', '/portfolio/balance')
+
+        assert len(requests) == KalshiClient._MAX_ATTEMPTS
@@ -0,0 +1,141 @@
+"""Market index tests: incremental sync in index_market_batches
+
+Runs against a real Chroma collection in a temporary directory, with a
+stub embedding model that records what it embeds.
+
+Run with: pytest tests/test_llama_index_service.py -v
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip('chromadb')
+pytest.importorskip('llama_index.core')
+pytest.importorskip('llama_index.vector_stores.chroma')
+
+from llama_index.core import VectorStoreIndex
+from llama_index.core.embeddings import MockEmbedding
+from pydantic import PrivateAttr
+
+import services.llama_index_service as llama_index_service
+from config import settings
+from services.llama_index_service import LlamaIndexService
+
+
+class RecordingEmbedding(MockEmbedding):
+    """MockEmbedding that records every text it embeds."""
+
+    _texts: list = PrivateAttr(default_factory=list)
+
+    @property
+    def texts(self) -> list:
+        return self._texts
+
+    def _get_text_embedding(self, text):
+        self._texts.append(text)
+        return [0.5] * self.embed_dim
+
+    def _get_text_embeddings(self, texts):
+        self._texts.extend(texts)
+        return [[0.5] * self.embed_dim for _ in texts]
+
+
+@pytest.fixture
+def embed_model():
+    return RecordingEmbedding(embed_dim=8)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch, embed_model):
+    """LlamaIndexService over an empty Chroma collection in tmp_path."""
+    monkeypatch.setattr(settings, 'chroma_path', tmp_path / 'chroma')
+    monkeypatch.setattr(llama_index_service, '_get_embed_model', lambda: embed_model)
+    service = LlamaIndexService()
+    service.init_index()
+    return service
+
+
+def market(ticker, title=None, yes_bid=40, volume=10):
+    """Kalshi market dict with the fields the index uses."""
+    return {
+        'ticker': ticker,
+        'event_ticker': f'EV-{ticker}',
+        'title': title or f'Will {ticker} happen?',
+        'category': 'Test',
+        'yes_bid': yes_bid,
+        'no_bid': 100 - yes_bid,
+        'volume': volume,
+        'close_time': '2026-12-31T23:59:59Z',
+        'status': 'open',
+    }
+
+
+def stored_metadata(service):
+    """Stored metadata by ticker, asserting one entry per ticker."""
+    metadatas = service.collection.get(include=['metadatas'])['metadatas']
+    by_ticker = {meta['ticker']: meta for meta in metadatas}
+    assert len(by_ticker) == len(metadatas), 'Duplicate entries for a ticker'
+    return by_ticker
+
+
+class TestIndexMarketBatches:
+    """Test the add/update/delete partitioning of a re-index."""
+
+    def test_unchanged_markets_not_reembedded(self, service, embed_model):
+        service.index_market_batches([[market('A'), market('B')]])
+        assert len(embed_model.texts) == 2
+
+        embed_model.texts.clear()
+        assert service.index_market_batches([[market('A')], [market('B')]]) == 2
+
+        assert embed_model.texts == []
+        assert stored_metadata(service).keys() == {'A', 'B'}
+
+    def test_price_only_change_updates_metadata_in_place(self, service, embed_model):
+        service.index_market_batches([[market('A'), market('B')]])
+        embed_model.texts.clear()
+
+        service.index_market_batches([[market('A', yes_bid=55, volume=99), market('B')]])
+
+        assert embed_model.texts == []
+        meta = stored_metadata(service)['A']
+        assert (meta['yes_price'], meta['no_price'], meta['volume']) == (55, 45, 99)
+        # Search results are rebuilt from LlamaIndex's JSON copy of the node
+        node_meta = json.loads(meta['_node_content'])['metadata']
+        assert (node_meta['yes_price'], node_meta['no_price'], node_meta['volume']) == (55, 45, 99)
+
+    def test_changed_text_reembedded(self, service, embed_model):
+        service.index_market_batches([[market('A'), market('B')]])
+        embed_model.texts.clear()
+
+        service.index_market_batches([[market('A', title='Will A happen by June?'), market('B')]])
+
+        assert len(embed_model.texts) == 1
+        assert 'Will A happen by June?' in embed_model.texts[0]
+        assert stored_metadata(service)['A']['title'] == 'Will A happen by June?'
+
+    def test_prices_not_embedded(self, service, embed_model):
+        service.index_market_batches([[market('A', yes_bid=37, volume=4321)]])
+
+        assert '4321' not in embed_model.texts[0]
+        assert 'yes_price' not in embed_model.texts[0]
+
+    def test_removed_tickers_deleted(self, service):
+        service.index_market_batches([[market('A'), market('B'), market('C')]])
+
+        assert service.index_market_batches([[market('A')], [market('C')]]) == 2
+
+        assert stored_metadata(service).keys() == {'A', 'C'}
+
+    def test_entries_without_content_hash_reembedded(self, service, embed_model):
+        # Entry written before content hashes were stored
+        document = LlamaIndexService._market_document(market('A'))
+        del document.metadata['content_hash']
+        VectorStoreIndex.from_documents([document], storage_context=service._storage_context)
+        embed_model.texts.clear()
+
+        service.index_market_batches([[market('A')]])
+
+        assert len(embed_model.texts) == 1
+        assert 'content_hash' in stored_metadata(service)['A']